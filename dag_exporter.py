@@ -3,7 +3,7 @@
 DAG Exporter - Common module for exporting dependency graphs
 """
 
-from typing import Dict
+from typing import Dict, Iterator
 
 from issue_parser import Issue
 
@@ -38,7 +38,8 @@ def export_dag(issues: Dict[str, Issue], filename: str = "epic_dag.dot") -> None
                 dot.edge(key, blocked_key)
 
     # Save DOT file
-    dot_path = filename.replace(".dot", "")
+    # Only the extension: replace() would also strip ".dot" from directory names
+    dot_path = filename[: -len(".dot")] if filename.endswith(".dot") else filename
     dot.save(filename)
     print(f"✅ Exported DOT file to {filename}")
 
@@ -51,6 +52,22 @@ def export_dag(issues: Dict[str, Issue], filename: str = "epic_dag.dot") -> None
         print("   Make sure Graphviz is installed: brew install graphviz")
 
 
+def _dot_node_lines(issues: Dict[str, Issue]) -> Iterator[str]:
+    """Yield one DOT node statement per issue, color coded by status"""
+    for key, issue in issues.items():
+        color = "lightgreen" if issue.is_complete else "lightblue"
+        label = f"{key}\\n{issue.story_points} pts\\n{issue.status}"
+        yield f'  "{key}" [label="{label}", style=filled, fillcolor={color}];\n'
+
+
+def _dot_edge_lines(issues: Dict[str, Issue]) -> Iterator[str]:
+    """Yield one DOT edge statement per blocks link between exported issues"""
+    for key, issue in issues.items():
+        for blocked_key in issue.blocks:
+            if blocked_key in issues:
+                yield f'  "{key}" -> "{blocked_key}";\n'
+
+
 def _export_dot_only(issues: Dict[str, Issue], filename: str) -> None:
     """Fallback: Export only DOT file without graphviz library"""
     with open(filename, "w") as f:
@@ -58,19 +75,10 @@ def _export_dot_only(issues: Dict[str, Issue], filename: str) -> None:
         f.write("  rankdir=LR;\n")
         f.write("  node [shape=box];\n\n")
 
-        # Color code by status
-        for key, issue in issues.items():
-            color = "lightgreen" if issue.is_complete else "lightblue"
-            label = f"{key}\\n{issue.story_points} pts\\n{issue.status}"
-            f.write(f'  "{key}" [label="{label}", style=filled, fillcolor={color}];\n')
-
+        # Stream statements straight into the file, one writelines call per section
+        f.writelines(_dot_node_lines(issues))
         f.write("\n")
-
-        # Add edges
-        for key, issue in issues.items():
-            for blocked_key in issue.blocks:
-                if blocked_key in issues:
-                    f.write(f'  "{key}" -> "{blocked_key}";\n')
+        f.writelines(_dot_edge_lines(issues))
 
         f.write("}\n")
 
@@ -9,11 +9,10 @@ import argparse
 import json
 import os
 import sys
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import networkx as nx
-import numpy as np
 
 from issue_parser import (
     build_dependency_graph,
@@ -25,24 +24,57 @@ from jira_client import JiraClient
 from scheduler import TaskScheduler
 
 
-def run_simulation(issues: Dict, graph: nx.DiGraph, num_engineers: int) -> Dict:
-    """Run scheduling simulation with specified number of engineers"""
+def build_schedule_plan(issues: Dict, graph: nx.DiGraph) -> List[Tuple[str, float, List[str]]]:
+    """
+    Precompute the scheduling input shared by every team size.
+
+    Args:
+        issues: Dict mapping issue key to Issue
+        graph: Dependency graph of the issues to schedule
+
+    Returns:
+        List of (issue key, story points, in-graph dependencies) in topological order
+    """
+    plan = []
+    for issue_key in nx.topological_sort(graph):
+        issue = issues[issue_key]
+        # Find dependencies that are in the graph
+        dependencies = [dep for dep in issue.blocked_by if dep in graph]
+        plan.append((issue_key, issue.story_points, dependencies))
+    return plan
+
+
+def run_simulation(
+    issues: Dict,
+    graph: nx.DiGraph,
+    num_engineers: int,
+    plan: Optional[List[Tuple[str, float, List[str]]]] = None,
+) -> Dict:
+    """Run scheduling simulation with specified number of engineers
+
+    Args:
+        issues: Dict mapping issue key to Issue
+        graph: Dependency graph of the issues to schedule
+        num_engineers: Team size to simulate
+        plan: Optional output of build_schedule_plan, reused across team sizes
+
+    Returns:
+        Dict with duration, per-engineer utilization and total effort
+    """
 
     if graph.number_of_nodes() == 0:
-        return {"duration": 0, "utilization": [], "total_effort": 0}
+        utilization = TaskScheduler(num_engineers).get_engineer_utilization()
+        return {"duration": 0, "utilization": utilization, "total_effort": 0}
 
-    # Get topological order for scheduling
-    topo_order = list(nx.topological_sort(graph))
+    if plan is None:
+        plan = build_schedule_plan(issues, graph)
 
     # Schedule tasks
     scheduler = TaskScheduler(num_engineers)
 
-    for issue_key in topo_order:
-        issue = issues[issue_key]
-        # Find dependencies that are in the graph
-        dependencies = [dep for dep in issue.blocked_by if dep in graph.nodes()]
+    for issue_key, story_points, dependencies in plan:
         scheduler.schedule_task(
-            issue_key, issue.story_points, dependencies  # Use story points as duration
+            issue_key, story_points, dependencies  # Use story points as duration
         )
 
     # Calculate metrics
@@ -54,8 +86,8 @@ def run_simulation(issues: Dict, graph: nx.DiGraph, num_engineers: int) -> Dict:
         "duration": project_duration,
         "utilization": utilization,
         "total_effort": total_effort,
-        "avg_utilization": np.mean(utilization) if utilization else 0,
-        "max_utilization": max(utilization) if utilization else 0,
+        "avg_utilization": float(utilization.mean()) if utilization.size else 0,
+        "max_utilization": float(utilization.max()) if utilization.size else 0,
     }
 
 
@@ -66,10 +98,13 @@ def analyze_engineer_scaling(
 
     results = []
 
+    # Topological order and dependency lists don't depend on team size
+    plan = build_schedule_plan(issues, graph)
+
     for num_engineers in range(1, max_engineers + 1):
         print(f"Simulating with {num_engineers} engineers...")
 
-        simulation = run_simulation(issues, graph, num_engineers)
+        simulation = run_simulation(issues, graph, num_engineers, plan)
 
         result = {
             "engineers": num_engineers,
@@ -338,15 +373,9 @@ def main():
             jira = JiraClient()
 
             # Search for all issues in the epic
+            # Only the fields parse_jira_issues reads; the epic is known from the JQL
             jql = f"parent = {args.epic_key}"
-            fields = [
-                "summary",
-                "status",
-                "issuetype",
-                args.story_points_field,
-                "issuelinks",
-                "parent",
-            ]
+            fields = ["summary", "status", args.story_points_field, "issuelinks"]
 
             raw_issues = jira.search_jql(jql, fields, max_results=500)
             print(f"Found {len(raw_issues)} issues")
@@ -20,45 +20,197 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import math
-import random
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import networkx as nx
+import numpy as np
 
 from issue_parser import (
+    IssueTable,
     build_dependency_graph,
     calculate_critical_path,
+    count_descendants,
     handle_cycles,
     parse_jira_issues,
+    rows_to_csr,
 )
 from jira_client import JiraClient
 
+# Number of simulation runs whose variance factors are drawn per NumPy call; each block
+# of runs has its own random stream, so results don't depend on how blocks are scheduled
+VARIANCE_DRAW_BATCH = 1024
+
+# Smallest run count worth handing to the compiled simulation kernel (when numba is installed)
+JIT_MIN_RUNS = 1000
+
+# Largest ticket count for which the NumPy lockstep simulation beats the per-run event
+# loop: every lockstep step scans all tickets of the runs it advances
+LOCKSTEP_MAX_TICKETS = 64
+
+# Smallest run count worth spreading over worker processes (without numba)
+PARALLEL_MIN_RUNS = 50_000
+
+# Most epic searches kept in flight at once when fetching several epics
+MAX_FETCH_WORKERS = 8
+
+# Simulation horizon: projects still unfinished after this many workdays are capped
+MAX_WORKDAYS = 365 * 2
+
+# Remaining work (in points) at or below which a ticket counts as done
+COMPLETION_TOLERANCE = 0.001
+
 
 def add_workdays(start: datetime, workdays: float) -> datetime:
     """Advance a date by N workdays, skipping weekends (Sat/Sun)."""
     whole_days = int(workdays)
-    current = start
-    added = 0
-    while added < whole_days:
-        current += timedelta(days=1)
-        if current.weekday() < 5:  # Mon-Fri
-            added += 1
-    return current
+    if whole_days <= 0:
+        return start
+    # Count from Mon-Fri (a weekend start counts from the Friday before it);
+    # whole weeks are 7 calendar days and a remainder crossing Friday adds the weekend
+    weekday = min(start.weekday(), 4)
+    full_weeks, rem = divmod(whole_days, 5)
+    if weekday + rem >= 5:
+        rem += 2
+    return start + timedelta(days=full_weeks * 7 + rem - (start.weekday() - weekday))
+
+
+def add_workdays_array(start: datetime, workdays: Any) -> List[datetime]:
+    """
+    Advance a date by each of several workday counts, skipping weekends.
+
+    Vectorized add_workdays: the calendar offsets are computed in one pass.
+
+    Args:
+        start: Date to count from
+        workdays: Workday counts (fractions are truncated)
+
+    Returns:
+        List of dates, aligned with workdays
+    """
+    whole_days = np.maximum(np.asarray(workdays, dtype=np.float64).astype(np.int64), 0)
+    weekday = min(start.weekday(), 4)
+    full_weeks, rem = np.divmod(whole_days, 5)
+    days = full_weeks * 7 + np.where(weekday + rem >= 5, rem + 2, rem)
+    days = np.where(whole_days > 0, days - (start.weekday() - weekday), 0)
+    return [start + timedelta(days=offset) for offset in days.tolist()]
+
+
+def work_to_workdays(work: np.ndarray, capacity_per_day: float) -> np.ndarray:
+    """
+    Quantize story-point work into whole workdays for one engineer.
+
+    A ticket is done on the first workday its remaining work drops to within
+    COMPLETION_TOLERANCE, and even empty tickets take one workday. Tickets that
+    cannot finish (no capacity) get MAX_WORKDAYS + 1.
+
+    Args:
+        work: Story points per ticket
+        capacity_per_day: Points one engineer completes per workday
+
+    Returns:
+        Integer array of workdays per ticket, aligned with work
+    """
+    work = np.asarray(work, dtype=np.float64)
+    if capacity_per_day <= 0:
+        return np.where(work <= COMPLETION_TOLERANCE, 1, MAX_WORKDAYS + 1).astype(np.int64)
+    days = np.ceil((work - COMPLETION_TOLERANCE) / capacity_per_day)
+    return np.clip(days, 1, MAX_WORKDAYS + 1).astype(np.int64)
+
+
+def workday_percentiles(
+    results: List[int], quantiles: Tuple[float, ...] = (0.50, 0.85, 0.95)
+) -> List[int]:
+    """
+    Pick percentiles from simulated completion workdays without a full sort.
+
+    Percentile q is the value at index int(n * q) of the sorted results.
+
+    Args:
+        results: Completion workday of each simulation run
+        quantiles: Percentiles to pick, as fractions
+
+    Returns:
+        Workdays per quantile, or zeros if there are no results
+    """
+    if not results:
+        return [0] * len(quantiles)
+    indices = [int(len(results) * q) for q in quantiles]
+    partitioned = np.partition(np.asarray(results), indices)
+    return [int(value) for value in partitioned[indices]]
+
+
+def load_simulation_kernel() -> Optional[Callable[..., Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Import the numba-compiled batch simulation kernel on first use.
+
+    Returns:
+        simulation_kernel.simulate_batch, or None when numba is not installed
+    """
+    try:
+        from simulation_kernel import simulate_batch
+    except ImportError:
+        return None
+    return simulate_batch
+
+
+def _csr_gather(
+    indptr: np.ndarray, indices: np.ndarray, runs: np.ndarray, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expand (run, row) pairs into (run, neighbor) pairs through a CSR adjacency.
+
+    Args:
+        indptr: CSR row pointers
+        indices: CSR column indices
+        runs: Run of each pair
+        rows: CSR row of each pair
+
+    Returns:
+        Tuple of the run and the neighbor of every expanded pair
+    """
+    counts = indptr[rows + 1] - indptr[rows]
+    starts = np.repeat(indptr[rows] - (np.cumsum(counts) - counts), counts)
+    return np.repeat(runs, counts), indices[starts + np.arange(counts.sum())]
 
 
 class EpicAnalyzer:
     """Analyzes epic dependencies and estimates timeline with Monte Carlo simulation"""
 
-    def __init__(self, jira_client: JiraClient, story_points_field: str = "customfield_10115"):
+    def __init__(
+        self,
+        jira_client: JiraClient,
+        story_points_field: str = "customfield_10115",
+        seed: Optional[int] = None,
+    ):
         self.jira = jira_client
         self.story_points_field = story_points_field
+        # Random stream for the Monte Carlo variance draws; a fixed seed makes runs reproducible
+        self._rng = np.random.default_rng(seed)
         self.issues: Dict = {}
         self.epic_keys: List[str] = []  # Track which epics are being analyzed
         self.issues_by_epic: Dict[str, Dict] = {}  # Map epic_key -> issues dict
+        # Cached complete/incomplete split of self.issues (see _partition_issues)
+        self._partition: Optional[Dict[str, Any]] = None
+        self._partition_source: Optional[Dict] = None
+        # Cached per-epic outstanding counts (see _index_epics)
+        self._epic_index: Optional[Dict[str, Any]] = None
+        self._epic_index_source: Optional[Tuple[Dict, Dict, Tuple[str, ...]]] = None
+
+    def _issue_fields(self) -> List[str]:
+        """
+        Jira fields the analysis reads from each issue.
+
+        Summary is only shown for critical path issues, but fetching it here is
+        cheaper than a second search round trip for those issues.
+        """
+        return ["summary", "status", self.story_points_field, "issuelinks"]
 
     def fetch_epic_issues(self, epic_key: str) -> None:
         """Fetch all issues for an epic"""
@@ -66,9 +218,7 @@ class EpicAnalyzer:
 
         # Search for all issues in the epic (using parent hierarchy)
         jql = f"parent = {epic_key}"
-        fields = ["summary", "status", "issuetype", self.story_points_field, "issuelinks", "parent"]
-
-        raw_issues = self.jira.search_jql(jql, fields, max_results=500)
+        raw_issues = self.jira.search_jql(jql, self._issue_fields(), max_results=500)
         print(f"Found {len(raw_issues)} issues")
 
         # Parse issues using common module
@@ -82,21 +232,20 @@ class EpicAnalyzer:
         self.issues = {}
         self.issues_by_epic = {}
 
-        for epic_key in epic_keys:
-            print(f"\nFetching issues for epic {epic_key}...")
+        fields = self._issue_fields()
 
+        def search_epic(epic_key: str) -> List[Dict]:
             # Search for all issues in the epic
-            jql = f"parent = {epic_key}"
-            fields = [
-                "summary",
-                "status",
-                "issuetype",
-                self.story_points_field,
-                "issuelinks",
-                "parent",
-            ]
+            return self.jira.search_jql(f"parent = {epic_key}", fields, max_results=500)
+
+        # Epic searches are independent network round trips, so run them concurrently;
+        # pages within one epic stay sequential (each needs the previous page's token)
+        workers = max(1, min(MAX_FETCH_WORKERS, len(epic_keys)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            raw_by_epic = list(executor.map(search_epic, epic_keys))
 
-            raw_issues = self.jira.search_jql(jql, fields, max_results=500)
+        for epic_key, raw_issues in zip(epic_keys, raw_by_epic):
+            print(f"\nFetched issues for epic {epic_key}")
             print(f"Found {len(raw_issues)} issues")
 
             # Parse issues using common module, passing epic_key
@@ -112,6 +261,202 @@ class EpicAnalyzer:
         """Get all issues for a specific epic"""
         return self.issues_by_epic.get(epic_key, {})
 
+    def _partition_issues(self) -> Dict[str, Any]:
+        """
+        Split issues into incomplete and completed sets in a single pass.
+
+        The split is reused by every simulation run and only rebuilt when
+        self.issues is replaced (e.g. by a new fetch).
+
+        Alongside the split, the incomplete issues' dependencies are indexed for
+        the simulator's ready queue: who each issue unblocks, how many unresolved
+        blockers it starts with, and its scheduling priority (issues that
+        transitively unblock the most downstream work first).
+
+        Returns:
+            Dict with incomplete_keys, completed_keys, base_story_points (aligned
+            with incomplete_keys), total_points, completed_points, dependents,
+            unmet_blockers, priority_order, priority_rank, priority_index (position
+            in incomplete_keys of each priority rank), the rank-indexed
+            dependents_indptr/dependents_indices (CSR) and unmet_by_rank arrays,
+            critical_path_points and critical_path_keys
+        """
+        if self._partition is not None and self._partition_source is self.issues:
+            return self._partition
+
+        table = IssueTable.from_issues(self.issues)
+        incomplete = ~table.complete
+        incomplete_keys: List[str] = [table.keys[i] for i in np.flatnonzero(incomplete)]
+        completed_keys: List[str] = [table.keys[i] for i in np.flatnonzero(table.complete)]
+        base_story_points = table.points[incomplete]
+        total_points = float(base_story_points.sum())
+        completed_points = float(table.points[table.complete].sum())
+
+        completed_set = frozenset(completed_keys)
+        incomplete_set = set(incomplete_keys)
+
+        # Blockers outside the tracked issues are never resolved, so they stay unmet
+        dependents: Dict[str, List[str]] = {key: [] for key in incomplete_keys}
+        unmet_blockers: Dict[str, int] = {}
+        for key in incomplete_keys:
+            unmet = 0
+            for blocker in self.issues[key].blocked_by:
+                if blocker in completed_set:
+                    continue
+                unmet += 1
+                if blocker in incomplete_set:
+                    dependents[blocker].append(key)
+            unmet_blockers[key] = unmet
+
+        # Pre-compute downstream descendant count for priority scheduling
+        G = build_dependency_graph(self.issues, include_completed=False)
+        G = handle_cycles(G)
+        critical_path_points, critical_path_keys = calculate_critical_path(G)
+        descendants = count_descendants(G)
+        descendant_count = {key: descendants.get(key, 0) for key in incomplete_keys}
+        order_index = {key: idx for idx, key in enumerate(incomplete_keys)}
+        priority_order = sorted(
+            incomplete_keys, key=lambda k: (-descendant_count[k], order_index[k])
+        )
+        priority_rank = {key: rank for rank, key in enumerate(priority_order)}
+
+        # The same dependency index by priority rank, for the compiled kernel
+        dependents_indptr, dependents_indices = rows_to_csr(
+            [[priority_rank[d] for d in dependents[key]] for key in priority_order]
+        )
+
+        self._partition = {
+            "incomplete_keys": incomplete_keys,
+            "completed_keys": completed_set,
+            "base_story_points": base_story_points,
+            "total_points": total_points,
+            "completed_points": completed_points,
+            "dependents": dependents,
+            "unmet_blockers": unmet_blockers,
+            "priority_order": priority_order,
+            "priority_rank": priority_rank,
+            "priority_index": np.array([order_index[key] for key in priority_order], dtype=np.intp),
+            "dependents_indptr": dependents_indptr,
+            "dependents_indices": dependents_indices,
+            "unmet_by_rank": np.array(
+                [unmet_blockers[key] for key in priority_order], dtype=np.int64
+            ),
+            "critical_path_points": critical_path_points,
+            "critical_path_keys": critical_path_keys,
+        }
+        self._partition_source = self.issues
+        return self._partition
+
+    def _index_epics(self) -> Dict[str, Any]:
+        """
+        Count each epic's outstanding issues for the simulator's completion tracking.
+
+        Cached until the issues, the per-epic issue map or the epic list change.
+
+        Returns:
+            Dict with epic_pending (epic -> incomplete issue count, for epics with
+            issues), epic_points (epic -> remaining story points) and
+            epics_of_issue (incomplete issue key -> its epics), plus
+            the same as arrays for the compiled kernel: epic_order (epics of
+            epic_pending), pending_by_epic and the rank-indexed epic_indptr/
+            epic_indices (CSR positions in epic_order)
+        """
+        partition = self._partition_issues()
+        source = (partition, self.issues_by_epic, tuple(self.epic_keys))
+        if self._epic_index is not None and self._epic_index_source is not None:
+            cached_partition, cached_by_epic, cached_epics = self._epic_index_source
+            if (
+                cached_partition is partition
+                and cached_by_epic is self.issues_by_epic
+                and cached_epics == source[2]
+            ):
+                return self._epic_index
+
+        epic_pending: Dict[str, int] = {}
+        epic_points: Dict[str, float] = {}
+        epics_of_issue: Dict[str, List[str]] = {}
+        for epic_key in self.epic_keys:
+            epic_issues = self.get_epic_issues(epic_key)
+            if not epic_issues:
+                continue
+            pending = 0
+            points = 0.0
+            for key, issue in epic_issues.items():
+                if key not in partition["completed_keys"]:
+                    pending += 1
+                    epics_of_issue.setdefault(key, []).append(epic_key)
+                if not issue.is_complete:
+                    points += issue.story_points
+            epic_pending[epic_key] = pending
+            epic_points[epic_key] = points
+
+        epic_order = list(epic_pending)
+        epic_position = {epic_key: idx for idx, epic_key in enumerate(epic_order)}
+        epic_indptr, epic_indices = rows_to_csr(
+            [
+                [epic_position[epic_key] for epic_key in epics_of_issue.get(key, ())]
+                for key in partition["priority_order"]
+            ]
+        )
+
+        self._epic_index = {
+            "epic_pending": epic_pending,
+            "epic_points": epic_points,
+            "epics_of_issue": epics_of_issue,
+            "epic_order": epic_order,
+            "pending_by_epic": np.array(
+                [epic_pending[epic_key] for epic_key in epic_order], dtype=np.int64
+            ),
+            "epic_indptr": epic_indptr,
+            "epic_indices": epic_indices,
+        }
+        self._epic_index_source = source
+        return self._epic_index
+
+    def _effective_capacity(
+        self, points_per_sprint_per_dev: float, sprint_weeks: int, efficiency: float
+    ) -> float:
+        """
+        Compute the story points one engineer completes per workday after Brooks's Law.
+
+        Args:
+            points_per_sprint_per_dev: Story points each developer completes per sprint
+            sprint_weeks: Length of sprint in weeks
+            efficiency: Team efficiency from _compute_team_efficiency
+
+        Returns:
+            Effective points per engineer per workday
+        """
+        workdays_per_sprint = sprint_weeks * 5
+        capacity_per_day = points_per_sprint_per_dev / workdays_per_sprint
+        return capacity_per_day * efficiency
+
+    def _sample_workdays_batch(
+        self,
+        runs: int,
+        effective_capacity: float,
+        variance: float,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """
+        Draw the per-ticket workdays for a batch of simulation runs in one NumPy block.
+
+        Args:
+            runs: Number of simulation runs in the batch
+            effective_capacity: Points one engineer completes per workday
+            variance: Std dev of per-item variance
+            rng: Random generator for the variance factors
+
+        Returns:
+            Integer array of shape (runs, incomplete issues), columns in priority order
+        """
+        partition = self._partition_issues()
+        base_points = partition["base_story_points"][partition["priority_index"]]
+        factors = np.maximum(0.1, rng.normal(1.0, variance, size=(runs, len(base_points)))).astype(
+            np.float32
+        )
+        return work_to_workdays(base_points * factors, effective_capacity)
+
     def _compute_team_efficiency(self, developers: float, coordination_factor: float) -> float:
         """
         Compute team efficiency factor based on team size (Brooks's Law).
@@ -145,6 +490,7 @@ class EpicAnalyzer:
         sprint_weeks: int,
         coordination_factor: float = 0.15,
         variance: float = 0.10,
+        variance_factors: Optional[np.ndarray] = None,
     ) -> Dict[str, Any]:
         """
         Run one discrete event Monte Carlo simulation iteration.
@@ -152,11 +498,12 @@ class EpicAnalyzer:
         Per simulation run:
         1. Apply variance to each work item's story points (fixed for the run)
         2. Compute effective daily capacity per engineer (Brooks's Law applied)
-        3. Iterate workday-by-workday:
+        3. Quantize each ticket's work into whole workdays at that capacity
+        4. Advance from one ticket completion to the next:
            - Idle engineers claim the next available ticket (DAG-respecting)
-           - Each engineer works on their ticket, reducing remaining work
-           - Completed tickets free the engineer for new work
-        4. Track when each epic and the overall project complete
+           - A claimed ticket completes after its workdays, freeing the engineer
+             (and any tickets it was blocking) from the following workday
+        5. Track when each epic and the overall project complete
 
         Args:
             developers: Number of developers (fractional OK, ceiled for headcount)
@@ -164,12 +511,15 @@ class EpicAnalyzer:
             sprint_weeks: Length of sprint in weeks
             coordination_factor: Brooks's Law overhead factor (default: 0.15)
             variance: Std dev of per-item variance (default: 0.10 = +/-10%)
+            variance_factors: Pre-drawn per-item variance factors aligned with the
+                incomplete issues; drawn here from `variance` when omitted
 
         Returns:
             Dict with completion_day and epic_completion_days
         """
         # Build the set of issues to simulate (only incomplete ones)
-        remaining_keys = [k for k, v in self.issues.items() if not v.is_complete]
+        partition = self._partition_issues()
+        remaining_keys: List[str] = partition["incomplete_keys"]
         if not remaining_keys:
             return {
                 "completion_day": 0,
@@ -177,106 +527,400 @@ class EpicAnalyzer:
             }
 
         # Apply variance to each work item (fixed for this simulation run)
-        remaining_work: Dict[str, float] = {}
-        for key in remaining_keys:
-            base_pts = self.issues[key].story_points
-            factor = max(0.1, random.gauss(1.0, variance))
-            remaining_work[key] = base_pts * factor
-
-        # Track completed issues in simulation (start with already-complete ones)
-        completed_in_sim: Set[str] = {k for k, v in self.issues.items() if v.is_complete}
+        if variance_factors is None:
+            variance_factors = np.maximum(
+                0.1, self._rng.normal(1.0, variance, size=len(remaining_keys))
+            )
+        remaining_work = partition["base_story_points"] * variance_factors
 
-        # Compute effective daily capacity per engineer
-        workdays_per_sprint = sprint_weeks * 5
-        capacity_per_day = points_per_sprint_per_dev / workdays_per_sprint
+        # Whole workdays an engineer needs for each ticket, in priority order
         efficiency = self._compute_team_efficiency(developers, coordination_factor)
-        effective_capacity = capacity_per_day * efficiency
-
-        # Initialize engineers - each tracks their current ticket
-        num_engineers = int(math.ceil(developers))
-        # current_issue is None when idle, or an issue key when working
-        engineer_issue: List[Optional[str]] = [None] * num_engineers
-
-        # Build dependency graph (incomplete issues only)
-        G = build_dependency_graph(self.issues, include_completed=False)
-        G = handle_cycles(G)
-
-        # Pre-compute downstream descendant count for priority scheduling.
-        # Tickets that transitively unblock the most work are picked first.
-        remaining_set = set(remaining_keys)
-        descendant_count: Dict[str, int] = {}
-        for key in remaining_set:
-            if key in G:
-                descendant_count[key] = len(nx.descendants(G, key))
-            else:
-                descendant_count[key] = 0
+        effective_capacity = self._effective_capacity(
+            points_per_sprint_per_dev, sprint_weeks, efficiency
+        )
+        workdays_needed = work_to_workdays(remaining_work, effective_capacity)
+        return self._simulate_schedule(
+            workdays_needed[partition["priority_index"]].tolist(), int(math.ceil(developers))
+        )
 
-        # Workday loop
-        max_workdays = 365 * 2
-        epic_completion_days: Dict[str, Optional[int]] = {e: None for e in self.epic_keys}
+    def _simulate_workdays_batch_seeded(
+        self,
+        seeds: np.ndarray,
+        developers: float,
+        points_per_sprint_per_dev: float,
+        sprint_weeks: int,
+        coordination_factor: float = 0.15,
+        variance: float = 0.10,
+    ) -> np.ndarray:
+        """
+        Simulate one run per seed in a single batch.
 
-        for workday in range(1, max_workdays + 1):
-            # Phase 1: Assign tickets to idle engineers
-            # Collect currently claimed tickets
-            claimed = {k for k in engineer_issue if k is not None}
+        Row i draws its variance factors from np.random.default_rng(seeds[i]) exactly
+        as _simulate_workdays_for_run would with that generator, so each result matches
+        a single seeded run.
 
-            for eng_idx in range(num_engineers):
-                if engineer_issue[eng_idx] is not None:
-                    continue  # Engineer is busy
+        Args:
+            seeds: Seed of each run
+            developers: Number of developers (fractional OK, ceiled for headcount)
+            points_per_sprint_per_dev: Story points each developer completes per sprint
+            sprint_weeks: Length of sprint in weeks
+            coordination_factor: Brooks's Law overhead factor (default: 0.15)
+            variance: Std dev of per-item variance (default: 0.10 = +/-10%)
 
-                # Find all available (unblocked, unclaimed) tickets
-                available = []
-                for key in remaining_set - completed_in_sim - claimed:
-                    deps = self.issues[key].blocked_by
-                    if deps.issubset(completed_in_sim):
-                        available.append(key)
+        Returns:
+            Integer array with the completion workday of each run
+        """
+        partition = self._partition_issues()
+        base_points = partition["base_story_points"]
+        if not len(base_points):
+            return np.zeros(len(seeds), dtype=np.int64)
 
-                if not available:
-                    continue
+        factors = np.empty((len(seeds), len(base_points)))
+        for row, seed in enumerate(seeds):
+            factors[row] = np.random.default_rng(seed).normal(1.0, variance, len(base_points))
+        np.maximum(factors, 0.1, out=factors)
 
-                # Pick the ticket that unblocks the most downstream work
-                best = max(available, key=lambda k: descendant_count[k])
-                engineer_issue[eng_idx] = best
-                claimed.add(best)
+        efficiency = self._compute_team_efficiency(developers, coordination_factor)
+        effective_capacity = self._effective_capacity(
+            points_per_sprint_per_dev, sprint_weeks, efficiency
+        )
+        workdays = work_to_workdays(base_points * factors, effective_capacity)
+        completion_days, _ = self._simulate_workdays_batch(
+            workdays[:, partition["priority_index"]], int(math.ceil(developers))
+        )
+        return completion_days
 
-            # Phase 2: Each engineer works on their ticket
-            for eng_idx in range(num_engineers):
-                issue_key = engineer_issue[eng_idx]
-                if issue_key is None:
-                    continue
+    def _simulate_schedule(self, workdays_by_rank: List[int], num_engineers: int) -> Dict[str, Any]:
+        """
+        Advance one simulation run from one ticket completion to the next.
 
-                # Apply daily capacity to remaining work
-                work_done = min(effective_capacity, remaining_work[issue_key])
-                remaining_work[issue_key] -= work_done
+        Args:
+            workdays_by_rank: Whole workdays each incomplete ticket takes, indexed by
+                priority rank
+            num_engineers: Engineers picking up tickets
 
-                # Check if ticket is complete
-                if remaining_work[issue_key] <= 0.001:
-                    completed_in_sim.add(issue_key)
-                    engineer_issue[eng_idx] = None  # Engineer is now idle
+        Returns:
+            Dict with completion_day and epic_completion_days
+        """
+        partition = self._partition_issues()
+        remaining_keys: List[str] = partition["incomplete_keys"]
+
+        idle_engineers = num_engineers
+        # Claimed tickets as a heap of (completion workday, priority rank)
+        in_progress: List[Tuple[int, int]] = []
+
+        # Ready queue of unblocked, unclaimed tickets as a heap of priority ranks.
+        # Tickets that transitively unblock the most work have the lowest rank.
+        priority_order: List[str] = partition["priority_order"]
+        priority_rank: Dict[str, int] = partition["priority_rank"]
+        dependents: Dict[str, List[str]] = partition["dependents"]
+        unmet_blockers: Dict[str, int] = dict(partition["unmet_blockers"])
+        ready = [priority_rank[k] for k in remaining_keys if unmet_blockers[k] == 0]
+        heapq.heapify(ready)
+
+        # Outstanding (not yet complete) issue count per epic
+        epic_index = self._index_epics()
+        epic_pending: Dict[str, int] = dict(epic_index["epic_pending"])
+        epics_of_issue: Dict[str, List[str]] = epic_index["epics_of_issue"]
 
-            # Phase 3: Check epic completion
-            for epic_key in self.epic_keys:
-                if epic_completion_days[epic_key] is not None:
-                    continue
-                epic_issues = self.get_epic_issues(epic_key)
-                if epic_issues:
-                    epic_remaining = [k for k in epic_issues if k not in completed_in_sim]
-                    if not epic_remaining:
+        epic_completion_days: Dict[str, Optional[int]] = {e: None for e in self.epic_keys}
+        # Epics with nothing left to do complete on the first simulated day
+        for epic_key, pending in epic_pending.items():
+            if pending == 0:
+                epic_completion_days[epic_key] = 1
+        remaining_count = len(remaining_keys)
+
+        workday = 1
+        while True:
+            # Assign the highest-priority available tickets to idle engineers
+            while idle_engineers and ready:
+                rank = heapq.heappop(ready)
+                finish_day = workday + workdays_by_rank[rank] - 1
+                heapq.heappush(in_progress, (finish_day, rank))
+                idle_engineers -= 1
+
+            # Nothing in progress means the rest is blocked on untracked issues
+            if not in_progress or in_progress[0][0] > MAX_WORKDAYS:
+                break
+
+            # Complete every ticket finishing on the next completion workday
+            workday = in_progress[0][0]
+            while in_progress and in_progress[0][0] == workday:
+                issue_key = priority_order[heapq.heappop(in_progress)[1]]
+                idle_engineers += 1
+                remaining_count -= 1
+
+                # Unblock dependents; they become available from the next workday
+                for dependent in dependents[issue_key]:
+                    unmet_blockers[dependent] -= 1
+                    if unmet_blockers[dependent] == 0:
+                        heapq.heappush(ready, priority_rank[dependent])
+
+                for epic_key in epics_of_issue.get(issue_key, ()):
+                    epic_pending[epic_key] -= 1
+                    if epic_pending[epic_key] == 0:
                         epic_completion_days[epic_key] = workday
 
-            # Phase 4: Check overall completion
-            if all(k in completed_in_sim for k in remaining_keys):
+            if remaining_count == 0:
                 return {
                     "completion_day": workday,
                     "epic_completion_days": epic_completion_days,
                 }
+            workday += 1
 
         # Safety limit reached
         return {
-            "completion_day": max_workdays,
+            "completion_day": MAX_WORKDAYS,
             "epic_completion_days": epic_completion_days,
         }
 
+    def _simulate_workdays_batch(
+        self, workdays_batch: np.ndarray, num_engineers: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Advance a whole batch of simulation runs in lockstep with NumPy.
+
+        Same schedule as _simulate_schedule for every run (and the same output as the
+        compiled kernel), with array operations across runs instead of a Python loop per
+        run: each step jumps to the earliest next ticket completion in the batch and only
+        touches the runs that have a completion on that workday.
+
+        Args:
+            workdays_batch: (runs, tickets) int64 workdays per ticket, columns in
+                priority order (see _sample_workdays_batch)
+            num_engineers: Engineers picking up tickets
+
+        Returns:
+            Tuple of completion workday per run and (runs, epics) epic completion
+            workdays in _index_epics epic_order, with -1 for epics that never complete
+        """
+        partition = self._partition_issues()
+        epic_index = self._index_epics()
+        runs, tickets = workdays_batch.shape
+
+        unmet = np.tile(partition["unmet_by_rank"], (runs, 1))
+        pending = np.tile(epic_index["pending_by_epic"], (runs, 1))
+        epic_days = np.where(pending == 0, 1, -1).astype(np.int64)
+        completion_days = np.full(runs, MAX_WORKDAYS, dtype=np.int64)
+        if tickets == 0:
+            return np.zeros(runs, dtype=np.int64), epic_days
+
+        # Completion workday of each claimed ticket; unclaimed and finished ones hold
+        # a value past the simulation horizon so a row minimum finds the next completion
+        not_in_progress = MAX_WORKDAYS + 1
+        finish = np.full((runs, tickets), not_in_progress, dtype=np.int64)
+        claimed = np.zeros((runs, tickets), dtype=np.bool_)
+        idle = np.full(runs, num_engineers, dtype=np.int64)
+        remaining = np.full(runs, tickets, dtype=np.int64)
+        next_completion = np.empty(runs, dtype=np.int64)
+
+        # Runs whose engineers or ready tickets changed on the last completion workday
+        rows = np.arange(runs)
+        workday = 1
+        while True:
+            # Idle engineers claim the lowest-ranked ready tickets of their run
+            ready = (unmet[rows] == 0) & ~claimed[rows]
+            take_row, take_rank = np.nonzero(ready & (np.cumsum(ready, axis=1) <= idle[rows, None]))
+            take_run = rows[take_row]
+            finish[take_run, take_rank] = workday + workdays_batch[take_run, take_rank] - 1
+            claimed[take_run, take_rank] = True
+            idle[rows] -= np.bincount(take_row, minlength=len(rows))
+
+            # Runs with nothing in progress are blocked on untracked issues and stop here
+            next_completion[rows] = finish[rows].min(axis=1)
+            workday = int(next_completion.min())
+            if workday > MAX_WORKDAYS:
+                break
+
+            # Complete every ticket finishing on the next completion workday of any run
+            rows = np.flatnonzero(next_completion == workday)
+            done_row, rank_of = np.nonzero(finish[rows] == workday)
+            run_of = rows[done_row]
+            finish[run_of, rank_of] = not_in_progress
+            done_count = np.bincount(done_row, minlength=len(rows))
+            idle[rows] += done_count
+            remaining[rows] -= done_count
+
+            # Unblock dependents; they become available from the next workday
+            dependent_runs, dependents = _csr_gather(
+                partition["dependents_indptr"], partition["dependents_indices"], run_of, rank_of
+            )
+            np.subtract.at(unmet, (dependent_runs, dependents), 1)
+
+            epic_runs, epics = _csr_gather(
+                epic_index["epic_indptr"], epic_index["epic_indices"], run_of, rank_of
+            )
+            np.subtract.at(pending, (epic_runs, epics), 1)
+            finished_epics = pending[epic_runs, epics] == 0
+            epic_days[epic_runs[finished_epics], epics[finished_epics]] = workday
+
+            finished = remaining[rows] == 0
+            completion_days[rows[finished]] = workday
+            next_completion[rows[finished]] = not_in_progress
+            rows = rows[~finished]
+            workday += 1
+
+        return completion_days, epic_days
+
+    def _run_simulations(
+        self,
+        runs: int,
+        epic_keys: List[str],
+        effective_capacity: float,
+        variance: float,
+        num_engineers: int,
+        block_seeds: List[np.random.SeedSequence],
+        simulate_batch: Optional[Callable[..., Tuple[np.ndarray, np.ndarray]]] = None,
+    ) -> Tuple[List[int], Dict[str, List[int]]]:
+        """
+        Run Monte Carlo simulations, drawing each block of runs' workdays at once.
+
+        Args:
+            runs: Number of simulation runs
+            epic_keys: Epics to collect completion workdays for
+            effective_capacity: Points one engineer completes per workday
+            variance: Std dev of per-item variance
+            num_engineers: Engineers picking up tickets
+            block_seeds: Seed of each block of VARIANCE_DRAW_BATCH runs (see
+                _spawn_block_seeds)
+            simulate_batch: Compiled batch kernel (see load_simulation_kernel); when
+                omitted, small epics run in the NumPy lockstep simulation
+                (_simulate_workdays_batch) and larger ones in the per-run event loop
+
+        Returns:
+            Tuple of the completion workday of every run and, per epic, the
+            completion workdays of the runs in which it completed
+        """
+        partition = self._partition_issues()
+        epic_index = self._index_epics()
+        workday_results: List[int] = []
+        epic_workday_results: Dict[str, List[int]] = {epic: [] for epic in epic_keys}
+
+        for batch_start, seed in zip(range(0, runs, VARIANCE_DRAW_BATCH), block_seeds):
+            batch_size = min(VARIANCE_DRAW_BATCH, runs - batch_start)
+            if not partition["incomplete_keys"]:
+                workday_results.extend([0] * batch_size)
+                for epic_key in epic_keys:
+                    if epic_key in self.epic_keys:
+                        epic_workday_results[epic_key].extend([0] * batch_size)
+                continue
+
+            workdays_batch = self._sample_workdays_batch(
+                batch_size, effective_capacity, variance, np.random.default_rng(seed)
+            )
+            if simulate_batch is not None:
+                completion_days, epic_days = simulate_batch(
+                    workdays_batch,
+                    num_engineers,
+                    partition["dependents_indptr"],
+                    partition["dependents_indices"],
+                    partition["unmet_by_rank"],
+                    epic_index["epic_indptr"],
+                    epic_index["epic_indices"],
+                    epic_index["pending_by_epic"],
+                    MAX_WORKDAYS,
+                )
+            elif workdays_batch.shape[1] <= LOCKSTEP_MAX_TICKETS:
+                completion_days, epic_days = self._simulate_workdays_batch(
+                    workdays_batch, num_engineers
+                )
+            else:
+                for workdays_row in workdays_batch.tolist():
+                    result = self._simulate_schedule(workdays_row, num_engineers)
+                    workday_results.append(result["completion_day"])
+
+                    for epic_key in epic_keys:
+                        completion_day = result["epic_completion_days"].get(epic_key)
+                        if completion_day is not None:
+                            epic_workday_results[epic_key].append(completion_day)
+                continue
+
+            workday_results.extend(completion_days.tolist())
+            for epic_key in epic_keys:
+                if epic_key in epic_index["epic_pending"]:
+                    column = epic_days[:, epic_index["epic_order"].index(epic_key)]
+                    epic_workday_results[epic_key].extend(column[column >= 0].tolist())
+
+        return workday_results, epic_workday_results
+
+    def _spawn_block_seeds(self, runs: int) -> List[np.random.SeedSequence]:
+        """
+        Spawn one independent seed per block of VARIANCE_DRAW_BATCH runs.
+
+        The seeds are derived from the analyzer's generator, and every simulation
+        path draws a block's variance factors from that block's seed, so a seeded
+        analyzer gives the same results whatever the worker count or path.
+
+        Args:
+            runs: Total number of simulation runs
+
+        Returns:
+            Seed of each block of runs, in run order
+        """
+        blocks = -(-runs // VARIANCE_DRAW_BATCH)
+        return np.random.SeedSequence(self._rng.integers(2**63)).spawn(blocks)
+
+    def _run_simulations_in_processes(
+        self,
+        workers: int,
+        runs: int,
+        epic_keys: List[str],
+        effective_capacity: float,
+        variance: float,
+        num_engineers: int,
+        block_seeds: List[np.random.SeedSequence],
+    ) -> Tuple[List[int], Dict[str, List[int]]]:
+        """
+        Split the blocks of simulation runs into one contiguous chunk per worker process.
+
+        Args:
+            workers: Number of worker processes
+            runs: Total number of simulation runs
+            epic_keys: Epics to collect completion workdays for
+            effective_capacity: Points one engineer completes per workday
+            variance: Std dev of per-item variance
+            num_engineers: Engineers picking up tickets
+            block_seeds: Seed of each block of VARIANCE_DRAW_BATCH runs
+
+        Returns:
+            Same as _run_simulations, with the chunks concatenated in order
+        """
+        chunks = []
+        for blocks in np.array_split(np.arange(len(block_seeds)), workers):
+            if len(blocks):
+                start = int(blocks[0]) * VARIANCE_DRAW_BATCH
+                stop = min(runs, (int(blocks[-1]) + 1) * VARIANCE_DRAW_BATCH)
+                chunks.append((stop - start, [block_seeds[block] for block in blocks]))
+
+        workday_results: List[int] = []
+        epic_workday_results: Dict[str, List[int]] = {epic: [] for epic in epic_keys}
+        # Spawn rather than fork: a forked copy of a process whose numba kernel has
+        # started its thread pool can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    simulate_chunk,
+                    self.issues,
+                    self.issues_by_epic,
+                    self.epic_keys,
+                    chunk,
+                    epic_keys,
+                    effective_capacity,
+                    variance,
+                    num_engineers,
+                    seeds,
+                )
+                for chunk, seeds in chunks
+            ]
+            for future in futures:
+                chunk_results, chunk_epic_results = future.result()
+                workday_results.extend(chunk_results)
+                for epic_key, days in chunk_epic_results.items():
+                    epic_workday_results[epic_key].extend(days)
+
+        return workday_results, epic_workday_results
+
     def estimate_timeline(
         self,
         epic_keys: Union[List[str], str, None] = None,
@@ -286,6 +930,7 @@ class EpicAnalyzer:
         coordination_factor: float = 0.15,
         simulations: int = 10000,
         variance: float = 0.10,
+        workers: Optional[int] = None,
     ) -> Dict:
         """
         Estimate timeline using discrete event Monte Carlo simulation.
@@ -298,6 +943,8 @@ class EpicAnalyzer:
             coordination_factor: Brooks's Law coordination overhead (default: 0.15, unused in new simulator but kept for compatibility)
             simulations: Number of Monte Carlo iterations (default: 10000)
             variance: Standard deviation of work item variance (default: 0.10 = ±10%)
+            workers: Worker processes for very large pure-Python runs (default: one per
+                CPU); seeded results are the same for any worker count
 
         Returns:
             Dict with estimates including p50/p85/p95 percentiles and calendar dates
@@ -305,24 +952,32 @@ class EpicAnalyzer:
         # Handle backward compatibility - if epic_keys is a string, convert to list
         if isinstance(epic_keys, str):
             epic_keys = [epic_keys]
-        assert epic_keys is not None, "epic_keys must be provided"
-        assert developers is not None, "developers must be provided"
-        assert points_per_sprint_per_dev is not None, "points_per_sprint_per_dev must be provided"
-        assert sprint_weeks is not None, "sprint_weeks must be provided"
+        if epic_keys is None:
+            raise ValueError("epic_keys must be provided")
+        if developers is None:
+            raise ValueError("developers must be provided")
+        if points_per_sprint_per_dev is None:
+            raise ValueError("points_per_sprint_per_dev must be provided")
+        if sprint_weeks is None:
+            raise ValueError("sprint_weeks must be provided")
+        if simulations < 1:
+            raise ValueError("simulations must be at least 1")
+        if not variance >= 0:
+            raise ValueError("variance must be non-negative")
         print("\nEstimating timeline...")
 
         # Calculate totals
-        total_points = sum(i.story_points for i in self.issues.values() if not i.is_complete)
-        completed_points = sum(i.story_points for i in self.issues.values() if i.is_complete)
+        partition = self._partition_issues()
+        total_points = partition["total_points"]
+        completed_points = partition["completed_points"]
 
         # Team capacity per sprint
         team_capacity_per_sprint = developers * points_per_sprint_per_dev
 
         # Build graph and calculate critical path using common modules
         print("\nCalculating critical path...")
-        G = build_dependency_graph(self.issues, include_completed=False)
-        G = handle_cycles(G)
-        critical_path_points, critical_path_keys = calculate_critical_path(G)
+        critical_path_points = partition["critical_path_points"]
+        critical_path_keys = partition["critical_path_keys"]
 
         # Deterministic estimates (for comparison)
         print(f"\nRunning {simulations:,} Monte Carlo simulations...")
@@ -334,42 +989,51 @@ class EpicAnalyzer:
         )
         estimated_sprints_raw = max(min_sprints_parallel, min_sprints_sequential)
 
-        # Initialize tracking for simulations
-        workday_results: List[float] = []
-        epic_workday_results: Dict[str, List[float]] = {epic: [] for epic in epic_keys}
+        # Without variance every run is identical, so simulate once and replicate the result
+        runs_needed = simulations if variance > 0 else min(simulations, 1)
+
+        # Efficiency only depends on team size, so compute it once for every run and the display
+        efficiency = self._compute_team_efficiency(developers, coordination_factor)
+        effective_capacity = self._effective_capacity(
+            points_per_sprint_per_dev, sprint_weeks, efficiency
+        )
+        num_engineers = int(math.ceil(developers))
+
+        # Large batches run in the compiled kernel when numba is available; without
+        # it, very large pure-Python runs are spread over worker processes instead
+        simulate_batch = load_simulation_kernel() if runs_needed >= JIT_MIN_RUNS else None
+        block_seeds = self._spawn_block_seeds(runs_needed)
+        workers = min(workers or os.cpu_count() or 1, len(block_seeds))
 
         print(f"\nRunning {simulations:,} discrete event Monte Carlo simulations...")
-        for _ in range(simulations):
-            result = self._simulate_workdays_for_run(
-                developers=developers,
-                points_per_sprint_per_dev=points_per_sprint_per_dev,
-                sprint_weeks=sprint_weeks,
-                coordination_factor=coordination_factor,
-                variance=variance,
+        if simulate_batch is None and runs_needed >= PARALLEL_MIN_RUNS and workers > 1:
+            workday_results, epic_workday_results = self._run_simulations_in_processes(
+                workers,
+                runs_needed,
+                epic_keys,
+                effective_capacity,
+                variance,
+                num_engineers,
+                block_seeds,
+            )
+        else:
+            workday_results, epic_workday_results = self._run_simulations(
+                runs_needed,
+                epic_keys,
+                effective_capacity,
+                variance,
+                num_engineers,
+                block_seeds,
+                simulate_batch,
             )
-            workday_results.append(result["completion_day"])
-
-            for epic_key in epic_keys:
-                completion_day = result["epic_completion_days"].get(epic_key)
-                if completion_day is not None:
-                    epic_workday_results[epic_key].append(completion_day)
 
-        # Sort results for percentile calculation
-        workday_results.sort()
-        for epic in epic_workday_results:
-            epic_workday_results[epic].sort()
+        if runs_needed < simulations:
+            workday_results *= simulations
+            for epic in epic_workday_results:
+                epic_workday_results[epic] *= simulations
 
         # Calculate percentiles
-        p50_idx = int(len(workday_results) * 0.50)
-        p85_idx = int(len(workday_results) * 0.85)
-        p95_idx = int(len(workday_results) * 0.95)
-
-        p50_workdays = workday_results[p50_idx]
-        p85_workdays = workday_results[p85_idx]
-        p95_workdays = workday_results[p95_idx]
-
-        # Calculate team efficiency for display
-        efficiency = self._compute_team_efficiency(developers, coordination_factor)
+        p50_workdays, p85_workdays, p95_workdays = workday_percentiles(workday_results)
 
         # Convert workdays to calendar dates (skipping weekends)
         now = datetime.now()
@@ -377,44 +1041,38 @@ class EpicAnalyzer:
         p85_weeks = p85_workdays / 5
         p95_weeks = p95_workdays / 5
 
-        p50_end_date = add_workdays(now, p50_workdays)
-        p85_end_date = add_workdays(now, p85_workdays)
-        p95_end_date = add_workdays(now, p95_workdays)
+        p50_end_date, p85_end_date, p95_end_date = add_workdays_array(
+            now, [p50_workdays, p85_workdays, p95_workdays]
+        )
 
         # Minimum workdays (critical path only, ignores other parallelizable work)
         min_workdays_critical = critical_path_points
 
         # Compute per-epic summaries for multi-epic analysis
         epic_summaries = {}
+        remaining_points_by_epic = self._index_epics()["epic_points"]
         for epic_key in epic_keys:
             epic_issues = self.get_epic_issues(epic_key)
             if epic_issues:
-                epic_points = sum(i.story_points for i in epic_issues.values() if not i.is_complete)
+                if epic_key in remaining_points_by_epic:
+                    epic_points = remaining_points_by_epic[epic_key]
+                else:
+                    epic_points = sum(
+                        i.story_points for i in epic_issues.values() if not i.is_complete
+                    )
 
                 # Get p50/p85/p95 for this epic from the simulation results
-                epic_p50_workdays = (
-                    epic_workday_results[epic_key][int(len(epic_workday_results[epic_key]) * 0.50)]
-                    if epic_workday_results[epic_key]
-                    else 0
-                )
-                epic_p85_workdays = (
-                    epic_workday_results[epic_key][int(len(epic_workday_results[epic_key]) * 0.85)]
-                    if epic_workday_results[epic_key]
-                    else 0
-                )
-                epic_p95_workdays = (
-                    epic_workday_results[epic_key][int(len(epic_workday_results[epic_key]) * 0.95)]
-                    if epic_workday_results[epic_key]
-                    else 0
+                epic_p50_workdays, epic_p85_workdays, epic_p95_workdays = workday_percentiles(
+                    epic_workday_results[epic_key]
                 )
 
                 epic_p50_weeks = epic_p50_workdays / 5
                 epic_p85_weeks = epic_p85_workdays / 5
                 epic_p95_weeks = epic_p95_workdays / 5
 
-                epic_p50_end_date = add_workdays(now, epic_p50_workdays)
-                epic_p85_end_date = add_workdays(now, epic_p85_workdays)
-                epic_p95_end_date = add_workdays(now, epic_p95_workdays)
+                epic_p50_end_date, epic_p85_end_date, epic_p95_end_date = add_workdays_array(
+                    now, [epic_p50_workdays, epic_p85_workdays, epic_p95_workdays]
+                )
 
                 epic_summaries[epic_key] = {
                     "total_points": epic_points,
@@ -441,12 +1099,21 @@ class EpicAnalyzer:
             "team_efficiency": round(efficiency, 4),
             "simulations": simulations,
             "total_issues": len(self.issues),
-            "completed_issues": sum(1 for i in self.issues.values() if i.is_complete),
-            "remaining_issues": sum(1 for i in self.issues.values() if not i.is_complete),
+            "completed_issues": len(partition["completed_keys"]),
+            "remaining_issues": len(partition["incomplete_keys"]),
             "total_points": total_points,
             "completed_points": completed_points,
             "critical_path_points": critical_path_points,
             "critical_path_issues": critical_path_keys,
+            "critical_path_detail": [
+                {
+                    "key": key,
+                    "summary": self.issues[key].summary,
+                    "story_points": self.issues[key].story_points,
+                    "epic_key": self.issues[key].epic_key,
+                }
+                for key in critical_path_keys
+            ],
             "team_capacity_per_sprint": team_capacity_per_sprint,
             "min_sprints_parallel": min_sprints_parallel,
             "min_sprints_sequential": min_sprints_sequential,
@@ -555,10 +1222,12 @@ class EpicAnalyzer:
                 self._print_epic_summary(epic_key, epic_summary)
 
         print(f"\n🔴 Critical Path ({len(timeline['critical_path_issues'])} issues):")
-        for i, key in enumerate(timeline["critical_path_issues"], 1):
-            issue = self.issues[key]
-            epic_info = f" [{issue.epic_key}]" if issue.epic_key else ""
-            print(f"  {i}. {key}: {issue.summary} ({issue.story_points} pts){epic_info}")
+        for i, detail in enumerate(timeline["critical_path_detail"], 1):
+            epic_info = f" [{detail['epic_key']}]" if detail["epic_key"] else ""
+            print(
+                f"  {i}. {detail['key']}: {detail['summary']} "
+                f"({detail['story_points']} pts){epic_info}"
+            )
 
         print("\n" + "=" * 90)
 
@@ -569,6 +1238,43 @@ class EpicAnalyzer:
         export_dag(self.issues, filename)
 
 
+def simulate_chunk(
+    issues: Dict,
+    issues_by_epic: Dict[str, Dict],
+    analyzed_epic_keys: List[str],
+    runs: int,
+    epic_keys: List[str],
+    effective_capacity: float,
+    variance: float,
+    num_engineers: int,
+    block_seeds: List[np.random.SeedSequence],
+) -> Tuple[List[int], Dict[str, List[int]]]:
+    """
+    Run a chunk of Monte Carlo simulations in a worker process.
+
+    Args:
+        issues: All fetched issues (EpicAnalyzer.issues)
+        issues_by_epic: Issues grouped by epic (EpicAnalyzer.issues_by_epic)
+        analyzed_epic_keys: Epics being analyzed (EpicAnalyzer.epic_keys)
+        runs: Number of simulation runs in this chunk
+        epic_keys: Epics to collect completion workdays for
+        effective_capacity: Points one engineer completes per workday
+        variance: Std dev of per-item variance
+        num_engineers: Engineers picking up tickets
+        block_seeds: Seed of each block of VARIANCE_DRAW_BATCH runs in this chunk
+
+    Returns:
+        Same as EpicAnalyzer._run_simulations
+    """
+    analyzer = EpicAnalyzer(jira_client=None)  # type: ignore[arg-type]
+    analyzer.issues = issues
+    analyzer.issues_by_epic = issues_by_epic
+    analyzer.epic_keys = analyzed_epic_keys
+    return analyzer._run_simulations(
+        runs, epic_keys, effective_capacity, variance, num_engineers, block_seeds
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Estimate epic timeline with Monte Carlo workday simulation"
@@ -608,6 +1314,12 @@ def main():
         default=10000,
         help="Number of Monte Carlo simulations (default: 10000)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible simulations (default: fresh entropy)",
+    )
     parser.add_argument(
         "--export-dag", action="store_true", help="Export dependency graph as DOT file"
     )
@@ -618,7 +1330,7 @@ def main():
     try:
         # Initialize client and analyzer
         jira = JiraClient()
-        analyzer = EpicAnalyzer(jira)
+        analyzer = EpicAnalyzer(jira, seed=args.seed)
 
         # Fetch and analyze
         if len(args.epic_keys) == 1:
@@ -3,49 +3,226 @@
 Issue Parser - Common module for parsing Jira issues and building dependency graphs
 """
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
+import numpy as np
+
+_COMPLETE_STATUSES = frozenset(["done", "closed", "duplicate", "won't fix"])
+
+# Status names as Jira spells them, normalized once: an epic only uses a handful
+_complete_by_status: Dict[str, bool] = {}
+
+
+def is_complete_status(status: str) -> bool:
+    """Check whether a Jira status name counts as complete"""
+    is_complete = _complete_by_status.get(status)
+    if is_complete is None:
+        is_complete = _complete_by_status[status] = status.lower() in _COMPLETE_STATUSES
+    return is_complete
 
 
 class Issue:
     """Represents a Jira issue with dependencies"""
 
+    # Fixed attribute layout: no per-instance __dict__ for the simulator's hot reads
+    __slots__ = (
+        "key",
+        "summary",
+        "status",
+        "story_points",
+        "epic_key",
+        "blocks",
+        "blocked_by",
+        "critical_path_length",
+        "earliest_start",
+        "is_complete",
+    )
+
     def __init__(
-        self, key: str, summary: str, status: str, story_points: float = 0, epic_key: str = None
+        self,
+        key: str,
+        summary: str,
+        status: str,
+        story_points: float = 0,
+        epic_key: Optional[str] = None,
     ):
         self.key = key
         self.summary = summary
         self.status = status
         self.story_points = story_points
         self.epic_key = epic_key  # Track which epic this issue belongs to
-        self.blocks: Set[str] = set()  # Issues this blocks
-        self.blocked_by: Set[str] = set()  # Issues blocking this
+        # Lists, not sets: most issues have 0-3 links and links are deduplicated at parse time
+        self.blocks: List[str] = []  # Issues this blocks
+        self.blocked_by: List[str] = []  # Issues blocking this
         self.critical_path_length = 0
         self.earliest_start = 0
-        self.is_complete = status.lower() in ["done", "closed", "duplicate", "won't fix"]
+        self.is_complete = is_complete_status(status)
 
     def __repr__(self):
         epic_info = f", epic={self.epic_key}" if self.epic_key else ""
         return f"Issue({self.key}, {self.story_points}pts, status={self.status}{epic_info})"
 
 
-def parse_jira_issues(
-    raw_issues: List[Dict], story_points_field: str = "customfield_10115", epic_key: str = None
-) -> Dict[str, Issue]:
+def _is_dependency_link(type_name: str, direction: str) -> bool:
     """
-    Parse raw Jira issues into Issue objects with dependencies
+    Check whether a link direction is a blocking dependency
+
+    Args:
+        type_name: Link type name (e.g. "Blocks")
+        direction: The link's outward or inward description (e.g. "is blocked by")
+
+    Returns:
+        True if the link means one issue blocks the other
+    """
+    return "block" in direction.lower() or "depend" in type_name.lower()
+
+
+# Jira's stock issue link types as (name, inward, outward)
+_STOCK_LINK_TYPES = (
+    ("Blocks", "is blocked by", "blocks"),
+    ("Cloners", "is cloned by", "clones"),
+    ("Duplicate", "is duplicated by", "duplicates"),
+    ("Relates", "relates to", "relates to"),
+)
+
+# Dependency classification per (type name, direction), shared by every parse. Link
+# types come from a small fixed vocabulary, so each pair is lowercased and
+# substring-checked once: the stock types up front, custom types on first sight.
+_dependency_links: Dict[Tuple[str, str], bool] = {
+    (name, direction): _is_dependency_link(name, direction)
+    for name, inward, outward in _STOCK_LINK_TYPES
+    for direction in (inward, outward)
+}
+
+
+def _classify_link(type_name: str, direction: str) -> bool:
+    """Memoized _is_dependency_link"""
+    pair = (type_name, direction)
+    is_dependency = _dependency_links.get(pair)
+    if is_dependency is None:
+        is_dependency = _dependency_links[pair] = _is_dependency_link(type_name, direction)
+    return is_dependency
+
+
+class IssueTable:
+    """Struct-of-arrays view of parsed issues for numeric passes over many issues"""
+
+    __slots__ = (
+        "keys",
+        "summaries",
+        "statuses",
+        "points",
+        "complete",
+        "blocks_indptr",
+        "blocks_indices",
+        "epic_key",
+    )
+
+    def __init__(
+        self,
+        keys: List[str],
+        summaries: List[str],
+        statuses: List[str],
+        points: np.ndarray,
+        complete: np.ndarray,
+        blocks_indptr: np.ndarray,
+        blocks_indices: np.ndarray,
+        epic_key: Optional[str] = None,
+    ):
+        self.keys = keys
+        self.summaries = summaries
+        self.statuses = statuses
+        self.points = points  # float64 story points per issue
+        self.complete = complete  # bool completion flag per issue
+        # Row i of the CSR lists the issues that issue i blocks
+        self.blocks_indptr = blocks_indptr
+        self.blocks_indices = blocks_indices
+        self.epic_key = epic_key
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_issues(cls, issues: Dict[str, Issue]) -> "IssueTable":
+        """
+        Build a table from Issue objects
+
+        Only "blocks" links between issues in the dictionary are kept.
+
+        Args:
+            issues: Dictionary of Issue objects
+
+        Returns:
+            IssueTable with rows in dictionary order
+        """
+        keys = list(issues)
+        position = {key: idx for idx, key in enumerate(keys)}
+        values = list(issues.values())
+        indptr, indices = rows_to_csr(
+            [sorted({position[k] for k in issue.blocks if k in position}) for issue in values]
+        )
+        return cls(
+            keys=keys,
+            summaries=[issue.summary for issue in values],
+            statuses=[issue.status for issue in values],
+            points=np.array([issue.story_points for issue in values], dtype=np.float64),
+            complete=np.array([issue.is_complete for issue in values], dtype=np.bool_),
+            blocks_indptr=indptr,
+            blocks_indices=indices,
+        )
+
+    def to_issues(self) -> Dict[str, Issue]:
+        """
+        Materialize Issue objects with their blocks/blocked_by links
+
+        Returns:
+            Dictionary mapping issue keys to Issue objects
+        """
+        issues = {
+            key: Issue(
+                key=key,
+                summary=summary,
+                status=status,
+                story_points=points,
+                epic_key=self.epic_key,
+            )
+            for key, summary, status, points in zip(
+                self.keys, self.summaries, self.statuses, self.points.tolist()
+            )
+        }
+        indptr = self.blocks_indptr.tolist()
+        indices = self.blocks_indices.tolist()
+        for row, key in enumerate(self.keys):
+            issue = issues[key]
+            for col in indices[indptr[row] : indptr[row + 1]]:
+                blocked_key = self.keys[col]
+                issue.blocks.append(blocked_key)
+                issues[blocked_key].blocked_by.append(key)
+        return issues
+
+
+def _parse_rows(
+    raw_issues: List[Dict], story_points_field: str
+) -> Tuple[List[str], List[str], List[str], List[float], List[Tuple[int, int]]]:
+    """
+    Parse raw Jira issues into parallel per-issue fields and dependency edges
 
     Args:
         raw_issues: List of raw issue dictionaries from Jira API
         story_points_field: Custom field ID for story points
 
     Returns:
-        Dictionary mapping issue keys to Issue objects
+        Tuple of (keys, summaries, statuses, story points) with one row per distinct
+        issue key, and the sorted, deduplicated (blocker row, blocked row) edges
     """
-    issues = {}
+    position: Dict[str, int] = {}
+    keys: List[str] = []
+    summaries: List[str] = []
+    statuses: List[str] = []
+    points: List[float] = []
 
-    # First pass: Create Issue objects
+    # First pass: One row per issue
     for raw in raw_issues:
         # Validate required fields
         if "key" not in raw or "fields" not in raw:
@@ -65,50 +242,108 @@ def parse_jira_issues(
         status_obj = fields.get("status")
         status = status_obj["name"] if status_obj and "name" in status_obj else "Unknown"
 
-        issue = Issue(
-            key=key,
-            summary=summary,
-            status=status,
-            story_points=float(story_points),
-            epic_key=epic_key,
-        )
-
-        issues[key] = issue
+        # A repeated key replaces the earlier row's data but keeps its position
+        row = position.setdefault(key, len(keys))
+        if row == len(keys):
+            keys.append(key)
+            summaries.append(summary)
+            statuses.append(status)
+            points.append(float(story_points))
+        else:
+            summaries[row] = summary
+            statuses[row] = status
+            points[row] = float(story_points)
+
+    # Second pass: Parse dependencies into (blocker row, blocked row) edges
+    edges: Set[Tuple[int, int]] = set()
 
-    # Second pass: Parse dependencies
     for raw in raw_issues:
         # Skip if issue wasn't parsed in first pass
-        if "key" not in raw or raw["key"] not in issues:
+        if "key" not in raw or raw["key"] not in position:
             continue
 
-        key = raw["key"]
-        issue = issues[key]
+        row = position[raw["key"]]
 
         for link in raw.get("fields", {}).get("issuelinks", []):
-            link_type = link["type"]["name"].lower()
+            link_type = link["type"]
+            type_name = link_type["name"]
 
             # Handle different link types
             if "outwardIssue" in link:
                 linked_key = link["outwardIssue"]["key"]
-                outward = link["type"]["outward"].lower()
-
-                if "block" in outward or "depend" in link_type:
-                    # This issue blocks the linked issue
-                    if linked_key in issues:
-                        issue.blocks.add(linked_key)
-                        issues[linked_key].blocked_by.add(key)
+                # This issue blocks the linked issue
+                if _classify_link(type_name, link_type["outward"]) and linked_key in position:
+                    edges.add((row, position[linked_key]))
 
             if "inwardIssue" in link:
                 linked_key = link["inwardIssue"]["key"]
-                inward = link["type"]["inward"].lower()
+                # The linked issue blocks this issue
+                if _classify_link(type_name, link_type["inward"]) and linked_key in position:
+                    edges.add((position[linked_key], row))
+
+    return keys, summaries, statuses, points, sorted(edges)
 
-                if "block" in inward or "depend" in link_type:
-                    # The linked issue blocks this issue
-                    if linked_key in issues:
-                        issue.blocked_by.add(linked_key)
-                        issues[linked_key].blocks.add(key)
 
-    return issues
+def parse_jira_issues_soa(
+    raw_issues: List[Dict],
+    story_points_field: str = "customfield_10115",
+    epic_key: Optional[str] = None,
+) -> IssueTable:
+    """
+    Parse raw Jira issues straight into an IssueTable
+
+    Args:
+        raw_issues: List of raw issue dictionaries from Jira API
+        story_points_field: Custom field ID for story points
+        epic_key: Epic the issues belong to
+
+    Returns:
+        IssueTable with one row per distinct issue key
+    """
+    keys, summaries, statuses, points, edges = _parse_rows(raw_issues, story_points_field)
+
+    rows: List[List[int]] = [[] for _ in keys]
+    for blocker, blocked in edges:
+        rows[blocker].append(blocked)
+    indptr, indices = rows_to_csr(rows)
+
+    return IssueTable(
+        keys=keys,
+        summaries=summaries,
+        statuses=statuses,
+        points=np.array(points, dtype=np.float64),
+        complete=np.array([is_complete_status(status) for status in statuses], dtype=np.bool_),
+        blocks_indptr=indptr,
+        blocks_indices=indices,
+        epic_key=epic_key,
+    )
+
+
+def parse_jira_issues(
+    raw_issues: List[Dict],
+    story_points_field: str = "customfield_10115",
+    epic_key: Optional[str] = None,
+) -> Dict[str, Issue]:
+    """
+    Parse raw Jira issues into Issue objects with dependencies
+
+    Args:
+        raw_issues: List of raw issue dictionaries from Jira API
+        story_points_field: Custom field ID for story points
+
+    Returns:
+        Dictionary mapping issue keys to Issue objects
+    """
+    keys, summaries, statuses, points, edges = _parse_rows(raw_issues, story_points_field)
+
+    issues = [
+        Issue(key=key, summary=summary, status=status, story_points=story_points, epic_key=epic_key)
+        for key, summary, status, story_points in zip(keys, summaries, statuses, points)
+    ]
+    for blocker, blocked in edges:
+        issues[blocker].blocks.append(keys[blocked])
+        issues[blocked].blocked_by.append(keys[blocker])
+    return dict(zip(keys, issues))
 
 
 def build_dependency_graph(issues: Dict[str, Issue], include_completed: bool = False) -> nx.DiGraph:
@@ -122,68 +357,219 @@ def build_dependency_graph(issues: Dict[str, Issue], include_completed: bool = F
     Returns:
         NetworkX DiGraph with story points as node and edge weights
     """
+    # Issues that belong in the graph, filtered once (dict keeps node order stable)
+    active = {
+        key: issue for key, issue in issues.items() if include_completed or not issue.is_complete
+    }
+
     G = nx.DiGraph()
 
     # Add nodes
-    for key, issue in issues.items():
-        if include_completed or not issue.is_complete:
-            G.add_node(key, story_points=issue.story_points, issue=issue)
-
-    # Add edges for dependencies
-    for key, issue in issues.items():
-        if include_completed or not issue.is_complete:
-            for blocked_key in issue.blocks:
-                if blocked_key in issues:
-                    blocked_issue = issues[blocked_key]
-                    if include_completed or not blocked_issue.is_complete:
-                        # Edge weight is the story points of the source node
-                        G.add_edge(key, blocked_key, weight=issue.story_points)
+    G.add_nodes_from(
+        (key, {"story_points": issue.story_points, "issue": issue}) for key, issue in active.items()
+    )
+
+    # Add edges for dependencies; edge weight is the story points of the source node
+    G.add_edges_from(
+        (key, blocked_key, {"weight": issue.story_points})
+        for key, issue in active.items()
+        for blocked_key in issue.blocks
+        if blocked_key in active
+    )
 
     return G
 
 
+def _find_back_edges(
+    G: nx.DiGraph,
+    component: Set[str],
+    position: Dict[str, int],
+    cycles: List[List[str]],
+    max_cycles: int = 3,
+) -> List[Tuple[str, str]]:
+    """
+    Depth-first search one strongly connected component for back edges
+
+    Removing every back edge of a DFS leaves the component acyclic.
+
+    Args:
+        G: NetworkX DiGraph
+        component: Nodes of one strongly connected component
+        position: Index of each node in G, so the search order is deterministic
+        cycles: Receives the DFS path each back edge closes, until it holds
+            max_cycles of them (for reporting)
+        max_cycles: Number of cycles to collect
+
+    Returns:
+        List of (source, target) back edges
+    """
+    on_path: Set[str] = set()
+    visited: Set[str] = set()
+    back_edges = []
+
+    for root in sorted(component, key=position.__getitem__):
+        if root in visited:
+            continue
+        visited.add(root)
+        on_path.add(root)
+        path = [root]
+        pending = [iter([s for s in G.successors(root) if s in component])]
+        while pending:
+            node = path[-1]
+            for successor in pending[-1]:
+                if successor in on_path:
+                    back_edges.append((node, successor))
+                    if len(cycles) < max_cycles:
+                        cycles.append(path[path.index(successor) :])
+                elif successor not in visited:
+                    visited.add(successor)
+                    on_path.add(successor)
+                    path.append(successor)
+                    pending.append(iter([s for s in G.successors(successor) if s in component]))
+                    break
+            else:
+                on_path.discard(path.pop())
+                pending.pop()
+
+    return back_edges
+
+
 def handle_cycles(G: nx.DiGraph) -> nx.DiGraph:
     """
     Detect and handle circular dependencies in the graph
 
+    Finds the strongly connected components that contain cycles and breaks
+    each with the back edges of a depth-first search, in linear time.
+
     Args:
         G: NetworkX DiGraph
 
     Returns:
         DAG with cycles removed
     """
-    if not nx.is_directed_acyclic_graph(G):
-        cycles = list(nx.simple_cycles(G))
-        print(f"⚠️  Warning: Found {len(cycles)} circular dependencies!")
-        for cycle in cycles[:3]:  # Show first 3
-            print(f"   Cycle: {' -> '.join(cycle)}")
-
-        # Preserve all nodes
-        nodes_to_preserve = list(G.nodes(data=True))
-
-        # Remove one edge per cycle (the first edge in each cycle)
-        edges_to_remove = set()
-        for cycle in cycles:
-            if len(cycle) > 1:
-                edges_to_remove.add((cycle[0], cycle[1]))
-                print(f"   Removing edge: {cycle[0]} -> {cycle[1]}")
-
-        # Rebuild graph without problematic edges
-        G = nx.DiGraph(
-            [(u, v, d) for u, v, d in G.edges(data=True) if (u, v) not in edges_to_remove]
-        )
-
-        # Ensure all nodes are preserved
-        for node, data in nodes_to_preserve:
-            if node not in G:
-                G.add_node(node, **data)
+    if nx.is_directed_acyclic_graph(G):
+        return G
+
+    self_loops = set(nx.nodes_with_selfloops(G))
+    components = [
+        component
+        for component in nx.strongly_connected_components(G)
+        if len(component) > 1 or component & self_loops
+    ]
+    position = {node: idx for idx, node in enumerate(G)}
+    cycles: List[List[str]] = []
+    back_edges = [
+        edge
+        for component in components
+        for edge in _find_back_edges(G, component, position, cycles)
+    ]
+
+    print(f"⚠️  Warning: Found {len(components)} group(s) of circular dependencies!")
+    for cycle in cycles:  # Show first 3
+        print(f"   Cycle: {' -> '.join(map(str, cycle))}")
+
+    # Rebuild graph without problematic edges, preserving all nodes
+    G = G.copy()
+    for source, target in back_edges:
+        print(f"   Removing edge: {source} -> {target}")
+        G.remove_edge(source, target)
 
     return G
 
 
+def rows_to_csr(rows: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack per-row integer lists into CSR (indptr, indices) int64 arrays
+
+    Args:
+        rows: Column indices for each row
+
+    Returns:
+        Tuple of indptr (len(rows) + 1) and the concatenated indices
+    """
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(row) for row in rows])
+    indices = np.fromiter((col for row in rows for col in row), dtype=np.int64, count=indptr[-1])
+    return indptr, indices
+
+
+def graph_to_csr(G: nx.DiGraph) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert a dependency graph into a compact CSR adjacency of its edges
+
+    Args:
+        G: NetworkX DiGraph with story_points node attributes
+
+    Returns:
+        Tuple of (keys, story points per key, indptr, indices), where the
+        successors of key i are indices[indptr[i]:indptr[i + 1]]
+    """
+    keys = list(G.nodes())
+    position = {key: idx for idx, key in enumerate(keys)}
+    points = np.array([G.nodes[key].get("story_points", 0) for key in keys], dtype=np.float64)
+    rows = [[position[successor] for successor in G.successors(key)] for key in keys]
+    return (keys, points) + rows_to_csr(rows)
+
+
+def longest_path_csr(
+    points: np.ndarray, indptr: np.ndarray, indices: np.ndarray
+) -> Tuple[float, List[int]]:
+    """
+    Find the path with the most story points through a CSR DAG
+
+    Orders the nodes topologically (Kahn's algorithm), then computes each
+    node's heaviest downstream chain in reverse topological order.
+
+    Args:
+        points: Story points per node
+        indptr: CSR row pointers of each node's successors
+        indices: CSR successor indices
+
+    Returns:
+        Tuple of (total story points, node indices along the path)
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    n = len(points)
+    if n == 0:
+        return 0.0, []
+
+    successors = indices.tolist()
+    starts = indptr.tolist()
+    in_degree = np.bincount(indices, minlength=n).tolist()
+    order = [node for node in range(n) if in_degree[node] == 0]
+    for node in order:
+        for successor in successors[starts[node] : starts[node + 1]]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                order.append(successor)
+    if len(order) < n:
+        raise ValueError("Dependency graph contains a cycle")
+
+    node_points = points.tolist()
+    best = [0.0] * n
+    next_node = [-1] * n
+    for node in reversed(order):
+        downstream = 0.0
+        for successor in successors[starts[node] : starts[node + 1]]:
+            if next_node[node] == -1 or best[successor] > downstream:
+                downstream = best[successor]
+                next_node[node] = successor
+        best[node] = node_points[node] + downstream
+
+    node = max(order, key=best.__getitem__)
+    length = best[node]
+    path = [node]
+    while next_node[node] != -1:
+        node = next_node[node]
+        path.append(node)
+    return length, path
+
+
 def calculate_critical_path(G: nx.DiGraph) -> Tuple[float, List[str]]:
     """
-    Calculate critical path using NetworkX DAG algorithms
+    Calculate the critical path: the dependency chain with the most story points
 
     Args:
         G: NetworkX DiGraph (must be a DAG)
@@ -194,20 +580,33 @@ def calculate_critical_path(G: nx.DiGraph) -> Tuple[float, List[str]]:
     if G.number_of_nodes() == 0:
         return 0.0, []
 
+    keys, points, indptr, indices = graph_to_csr(G)
     try:
-        # Find the longest path (critical path) using NetworkX
-        critical_path = nx.dag_longest_path(G, weight="weight")
+        critical_path_length, path = longest_path_csr(points, indptr, indices)
+    except ValueError as e:
+        raise nx.NetworkXUnfeasible(str(e)) from e
 
-        # Calculate total story points along the critical path
-        # Include the last node's story points (not counted as an edge weight)
-        critical_path_length = nx.dag_longest_path_length(G, weight="weight")
-        if critical_path:
-            last_node_data = G.nodes[critical_path[-1]]
-            last_node_points = last_node_data.get("story_points", 0)
-            critical_path_length += last_node_points
+    return critical_path_length, [keys[node] for node in path]
 
-        return critical_path_length, critical_path
 
-    except nx.NetworkXError as e:
-        print(f"⚠️  Error calculating critical path: {e}")
-        return 0.0, []
+def count_descendants(G: nx.DiGraph) -> Dict[str, int]:
+    """
+    Count the issues each issue transitively blocks
+
+    Propagates reachability bitsets in reverse topological order, so every
+    edge is visited once instead of running a separate graph search per node.
+
+    Args:
+        G: NetworkX DiGraph (must be a DAG)
+
+    Returns:
+        Dict mapping each node to its number of descendants
+    """
+    position = {node: idx for idx, node in enumerate(G)}
+    reach: Dict[str, int] = {}
+    for node in reversed(list(nx.topological_sort(G))):
+        bits = 0
+        for successor in G.successors(node):
+            bits |= reach[successor] | (1 << position[successor])
+        reach[node] = bits
+    return {node: bin(bits).count("1") for node, bits in reach.items()}
@@ -7,50 +7,80 @@ import os
 from typing import Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional faster JSON decoding (pip install project-management[fast])
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 
 class JiraClient:
     """Simple Jira API client using environment variables"""
 
     def __init__(self):
-        self.base_url = os.getenv("JIRA_BASE_URL")
-        self.email = os.getenv("JIRA_EMAIL")
-        self.token = os.getenv("JIRA_TOKEN")
-
-        if not all([self.base_url, self.email, self.token]):
-            raise ValueError(
-                "Missing required environment variables: " "JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN"
-            )
-
-        self.base_url = self.base_url.rstrip("/")
+        env = {name: os.getenv(name) for name in ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_TOKEN")}
+        missing = [name for name, value in env.items() if not value]
+        if missing:
+            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+
+        self.base_url: str = str(env["JIRA_BASE_URL"]).rstrip("/")
+        self.email: str = str(env["JIRA_EMAIL"])
+        self.token: str = str(env["JIRA_TOKEN"])
         self.auth = (self.email, self.token)
 
+        # One session for all requests: reuses pooled keep-alive connections (and TLS)
+        self.session = requests.Session()
+        self.session.auth = self.auth
+
+        # Pool sized for concurrent epic fetches; retry throttled and transient failures
+        # on the (read-only) GETs with exponential backoff
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def search_jql(self, jql: str, fields: List[str], max_results: int = 100) -> List[Dict]:
-        """Search Jira using JQL with the v3 API"""
+        """
+        Search Jira using JQL with the v3 API
+
+        Pages are fetched one after another: each page's nextPageToken is only
+        known once the previous page has arrived.
+        """
         url = f"{self.base_url}/rest/api/3/search/jql"
+        # Query parameters are the same for every page apart from the page token
+        base_params: Dict[str, object] = {
+            "jql": jql,
+            "fields": ",".join(fields),
+            "maxResults": max_results,
+        }
 
         all_issues: List[Dict] = []
         next_page_token: object = None
 
         while True:
-            params: Dict[str, object] = {
-                "jql": jql,
-                "fields": ",".join(fields),
-                "maxResults": max_results,
-            }
-
+            params = base_params
             if next_page_token:
-                params["nextPageToken"] = next_page_token
+                params = {**base_params, "nextPageToken": next_page_token}
 
-            response = requests.get(url, auth=self.auth, params=params, timeout=30)  # type: ignore[arg-type]
+            response = self.session.get(url, params=params, timeout=30)  # type: ignore[arg-type]
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
 
             issues = data.get("issues", [])
             all_issues.extend(issues)
 
-            # Check if there are more pages
-            if data.get("isLast", True):
+            # Check if there are more pages; an empty page can't advance the cursor either
+            if data.get("isLast", True) or not issues:
                 break
 
             next_page_token = data.get("nextPageToken")
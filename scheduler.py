@@ -3,67 +3,466 @@
 Task Scheduler - Common module for scheduling tasks across engineers
 """
 
-from typing import Dict, List
+import math
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+# Rows allocated up front for scheduled tasks; the columns double whenever they fill up
+INITIAL_TASK_CAPACITY = 64
+
+
+class _TaskTimesView(Mapping[str, float]):
+    """Maps task names to one time column of a TaskScheduler via its task_index"""
+
+    def __init__(self, scheduler: "TaskScheduler", column: str):
+        self._scheduler = scheduler
+        self._column = column
+
+    def __getitem__(self, task_name: str) -> float:
+        row = self._scheduler.task_index[task_name]
+        return float(getattr(self._scheduler, self._column)[row])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scheduler.task_index)
+
+    def __len__(self) -> int:
+        return len(self._scheduler.task_index)
+
+
+def _topological_order(blockers: List[List[int]]) -> List[int]:
+    """
+    Order batch positions so every task comes after its blockers (Kahn's algorithm)
+
+    Args:
+        blockers: Batch positions each task depends on
+
+    Returns:
+        Batch positions in scheduling order, ties kept in batch order
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    dependents: List[List[int]] = [[] for _ in blockers]
+    in_degree = [len(task_blockers) for task_blockers in blockers]
+    for idx, task_blockers in enumerate(blockers):
+        for blocker in task_blockers:
+            dependents[blocker].append(idx)
+
+    order = [idx for idx in range(len(blockers)) if in_degree[idx] == 0]
+    for idx in order:
+        for dependent in dependents[idx]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                order.append(dependent)
+    if len(order) < len(blockers):
+        raise ValueError("Task dependencies contain a cycle")
+    return order
 
 
 class TaskScheduler:
-    """Schedules tasks across multiple engineers with dependency constraints"""
+    """Schedules tasks across multiple engineers with dependency constraints
+
+    Scheduled tasks are stored column-wise, one row per schedule_task call in
+    scheduling order: task_names plus the task_start, task_end, task_duration and
+    task_engineer arrays. task_index maps a task name to its (latest) row, and the
+    rows of the dependencies each task waited on are kept as a CSR adjacency
+    (dependency_indptr, dependency_indices).
+
+    Engineer end times are mirrored in a min tournament tree (a complete binary
+    tree whose leaves are the engineers and whose inner nodes hold the minimum
+    of their subtree), so picking an engineer takes O(log engineers).
+    """
 
-    def __init__(self, num_engineers: int):
+    __slots__ = (
+        "num_engineers",
+        "dtype",
+        "engineer_end_times",
+        "task_names",
+        "task_index",
+        "_start",
+        "_end",
+        "_duration",
+        "_engineer",
+        "_dependency_indptr",
+        "_dependency_indices",
+        "_dependency_count",
+        "_tree_leaves",
+        "_end_time_tree",
+        "_project_duration",
+    )
+
+    def __init__(self, num_engineers: int, expected_tasks: int = 0, dtype: DTypeLike = np.float64):
+        # Room for expected_tasks rows up front, so scheduling that many never regrows a column
+        capacity = max(INITIAL_TASK_CAPACITY, expected_tasks)
+        # Float type of every stored time; np.float32 halves their memory for day-scale schedules
+        self.dtype = np.dtype(dtype)
         self.num_engineers = num_engineers
-        self.engineer_schedules: List[List[Dict]] = [[] for _ in range(num_engineers)]
-        self.engineer_end_times: List[float] = [0.0] * num_engineers
-        self.task_start_times: Dict[str, float] = {}
-        self.task_end_times: Dict[str, float] = {}
+        self.engineer_end_times = np.zeros(num_engineers, dtype=self.dtype)
+        self.task_names: List[str] = []
+        self.task_index: Dict[str, int] = {}
+        self._start = np.empty(capacity, dtype=self.dtype)
+        self._end = np.empty(capacity, dtype=self.dtype)
+        self._duration = np.empty(capacity, dtype=self.dtype)
+        self._engineer = np.empty(capacity, dtype=np.int32)
+        self._dependency_indptr = np.zeros(capacity + 1, dtype=np.int64)
+        self._dependency_indices = np.empty(capacity, dtype=np.int64)
+        self._dependency_count = 0
+        self._build_end_time_tree()
 
-    def schedule_task(self, task_name: str, duration_days: float, dependencies: List[str]) -> int:
-        """Schedule a task and return the assigned engineer index"""
-        # Validate inputs
-        if duration_days < 0:
+    def reset(self, num_engineers: Optional[int] = None) -> None:
+        """
+        Clear all scheduled tasks, keeping the allocated task columns
+
+        Args:
+            num_engineers: New team size (defaults to the current one)
+        """
+        if num_engineers is not None and num_engineers != self.num_engineers:
+            self.num_engineers = num_engineers
+            self.engineer_end_times = np.zeros(num_engineers, dtype=self.dtype)
+        else:
+            self.engineer_end_times.fill(0.0)
+        self.task_names = []
+        self.task_index = {}
+        self._dependency_count = 0
+        self._build_end_time_tree()
+
+    def _build_end_time_tree(self) -> None:
+        """Rebuild the tournament tree from engineer_end_times"""
+        leaves = 1
+        while leaves < self.num_engineers:
+            leaves *= 2
+        tree = [math.inf] * (2 * leaves)
+        tree[leaves : leaves + self.num_engineers] = self.engineer_end_times.tolist()
+        for node in range(leaves - 1, 0, -1):
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+        self._tree_leaves = leaves
+        self._end_time_tree = tree
+        self._project_duration = float(self.engineer_end_times.max()) if self.num_engineers else 0.0
+
+    def _earliest_engineer(self, earliest_start: float) -> Tuple[int, float]:
+        """
+        Pick the engineer who can start earliest, the lowest index on ties
+
+        The best start is max(earliest_start, soonest end time); every engineer
+        free by then ties, so descend to the leftmost leaf at or below it.
+
+        Returns:
+            Tuple of (engineer index, start time)
+        """
+        tree = self._end_time_tree
+        start_time = max(earliest_start, tree[1])
+        node = 1
+        while node < self._tree_leaves:
+            node *= 2
+            if tree[node] > start_time:
+                node += 1
+        return node - self._tree_leaves, start_time
+
+    def _set_end_time(self, engineer: int, end_time: float) -> None:
+        """Record an engineer's new end time, updating the tree minima above it"""
+        self.engineer_end_times[engineer] = end_time
+        # End times only move later, so the project duration is their running maximum
+        if end_time > self._project_duration:
+            self._project_duration = end_time
+        tree = self._end_time_tree
+        node = engineer + self._tree_leaves
+        tree[node] = end_time
+        node //= 2
+        while node:
+            smallest = min(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == smallest:
+                break
+            tree[node] = smallest
+            node //= 2
+
+    @property
+    def task_start(self) -> np.ndarray:
+        """Start time of each scheduled task, by row"""
+        return self._start[: len(self.task_names)]
+
+    @property
+    def task_end(self) -> np.ndarray:
+        """End time of each scheduled task, by row"""
+        return self._end[: len(self.task_names)]
+
+    @property
+    def task_duration(self) -> np.ndarray:
+        """Duration of each scheduled task, by row"""
+        return self._duration[: len(self.task_names)]
+
+    @property
+    def task_engineer(self) -> np.ndarray:
+        """Engineer assigned to each scheduled task, by row"""
+        return self._engineer[: len(self.task_names)]
+
+    @property
+    def dependency_indptr(self) -> np.ndarray:
+        """CSR row pointers into dependency_indices, one entry per row plus one"""
+        return self._dependency_indptr[: len(self.task_names) + 1]
+
+    @property
+    def dependency_indices(self) -> np.ndarray:
+        """Rows each scheduled task waited on, concatenated in row order"""
+        return self._dependency_indices[: self._dependency_count]
+
+    @property
+    def task_dependency_rows(self) -> List[List[int]]:
+        """Rows of the dependencies each scheduled task waited on, by row"""
+        indptr = self.dependency_indptr.tolist()
+        indices = self.dependency_indices.tolist()
+        return [indices[indptr[row] : indptr[row + 1]] for row in range(len(self.task_names))]
+
+    @property
+    def task_start_times(self) -> Mapping[str, float]:
+        """Start time per task name (a read-only view over the task_start column)"""
+        return _TaskTimesView(self, "_start")
+
+    @property
+    def task_end_times(self) -> Mapping[str, float]:
+        """End time per task name (a read-only view over the task_end column)"""
+        return _TaskTimesView(self, "_end")
+
+    @property
+    def engineer_task_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rows of the tasks each engineer works on, as a CSR adjacency
+
+        Returns:
+            Tuple of indptr (num_engineers + 1) and the task rows grouped by
+            engineer, each engineer's rows in scheduling order
+        """
+        engineers = self.task_engineer
+        indptr = np.zeros(self.num_engineers + 1, dtype=np.int64)
+        np.cumsum(np.bincount(engineers, minlength=self.num_engineers), out=indptr[1:])
+        return indptr, np.argsort(engineers, kind="stable")
+
+    @property
+    def engineer_schedules(self) -> List[List[Dict]]:
+        """Tasks assigned to each engineer, in scheduling order"""
+        indptr, rows = self.engineer_task_rows
+        starts = self.task_start[rows].tolist()
+        ends = self.task_end[rows].tolist()
+        durations = self.task_duration[rows].tolist()
+        names = [self.task_names[row] for row in rows.tolist()]
+        bounds = indptr.tolist()
+        return [
+            [
+                {"task": names[i], "start": starts[i], "end": ends[i], "duration": durations[i]}
+                for i in range(bounds[engineer], bounds[engineer + 1])
+            ]
+            for engineer in range(self.num_engineers)
+        ]
+
+    def _grow(self) -> None:
+        """Double the capacity of the task columns"""
+        capacity = 2 * self._start.shape[0]
+        for name in ("_start", "_end", "_duration", "_engineer"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: column.shape[0]] = column
+            setattr(self, name, grown)
+        indptr = np.zeros(capacity + 1, dtype=np.int64)
+        indptr[: self._dependency_indptr.shape[0]] = self._dependency_indptr
+        self._dependency_indptr = indptr
+
+    def _grow_dependencies(self, needed: int) -> None:
+        """Double the dependency index capacity until it holds needed entries"""
+        capacity = 2 * self._dependency_indices.shape[0]
+        while capacity < needed:
+            capacity *= 2
+        grown = np.empty(capacity, dtype=np.int64)
+        grown[: self._dependency_count] = self._dependency_indices[: self._dependency_count]
+        self._dependency_indices = grown
+
+    @staticmethod
+    def _check_duration(task_name: str, duration_days: float) -> None:
+        """Reject negative and NaN durations (NaN fails every comparison, even with itself)"""
+        if duration_days < 0 or duration_days != duration_days:
             raise ValueError(
                 f"Duration must be non-negative, got {duration_days} for task {task_name}"
             )
 
-        # Calculate earliest start time based on dependencies
-        earliest_start = 0.0
+    def schedule_task(self, task_name: str, duration_days: float, dependencies: List[str]) -> int:
+        """Schedule a task and return the assigned engineer index"""
+        # Validate inputs
+        self._check_duration(task_name, duration_days)
+
+        # Dependencies that were never scheduled don't hold the task back
+        dependency_rows = []
         for dep in dependencies:
-            if dep in self.task_end_times:
-                earliest_start = max(earliest_start, self.task_end_times[dep])
+            row = self.task_index.get(dep)
+            if row is not None:
+                dependency_rows.append(row)
+        return self._place_task(task_name, duration_days, dependency_rows)
 
-        # Find the engineer who can start earliest (considering their current workload)
-        best_engineer = 0
-        best_start_time = max(earliest_start, self.engineer_end_times[0])
+    def _place_task(self, task_name: str, duration_days: float, dependency_rows: List[int]) -> int:
+        """Append a validated task waiting on the given rows and return its engineer"""
+        # Calculate earliest start time based on dependencies
+        earliest_start = 0.0
+        for row in dependency_rows:
+            earliest_start = max(earliest_start, float(self._end[row]))
 
-        for i in range(1, self.num_engineers):
-            candidate_start = max(earliest_start, self.engineer_end_times[i])
-            if candidate_start < best_start_time:
-                best_engineer = i
-                best_start_time = candidate_start
+        if self.num_engineers == 0:
+            raise ValueError(f"No engineers to schedule task {task_name} on")
 
-        # Schedule the task
-        start_time = best_start_time
+        # Find the engineer who can start earliest (considering their current workload);
+        # ties go to the lowest index, so idle engineers fill up in order
+        best_engineer, start_time = self._earliest_engineer(earliest_start)
         end_time = start_time + duration_days
 
-        self.task_start_times[task_name] = float(start_time)
-        self.task_end_times[task_name] = float(end_time)
-        self.engineer_end_times[best_engineer] = float(end_time)
-
-        self.engineer_schedules[best_engineer].append(
-            {"task": task_name, "start": start_time, "end": end_time, "duration": duration_days}
-        )
+        row = len(self.task_names)
+        if row == self._start.shape[0]:
+            self._grow()
+        self.task_names.append(task_name)
+        self.task_index[task_name] = row
+        if dependency_rows:
+            count = self._dependency_count + len(dependency_rows)
+            if count > self._dependency_indices.shape[0]:
+                self._grow_dependencies(count)
+            self._dependency_indices[self._dependency_count : count] = dependency_rows
+            self._dependency_count = count
+        self._dependency_indptr[row + 1] = self._dependency_count
+        self._start[row] = start_time
+        self._end[row] = end_time
+        self._duration[row] = duration_days
+        self._engineer[row] = best_engineer
+        # Read the end time back so the tree holds exactly the stored (possibly rounded) value
+        self._set_end_time(best_engineer, float(self._end[row]))
 
         return best_engineer
 
+    def schedule_tasks(self, tasks: List[Tuple[str, float, List[str]]]) -> np.ndarray:
+        """
+        Schedule a batch of tasks in dependency order
+
+        Tasks may be listed in any order: each is scheduled once all of its
+        dependencies within the batch are (Kahn's algorithm, ties kept in list
+        order). Dependencies outside the batch are handled as in schedule_task.
+
+        Args:
+            tasks: (task name, duration in days, dependency names) per task
+
+        Returns:
+            Engineer index assigned to each task, aligned with tasks
+
+        Raises:
+            ValueError: If a duration is negative or the batch has a dependency cycle
+        """
+        for task_name, duration_days, _ in tasks:
+            self._check_duration(task_name, duration_days)
+
+        position = {task[0]: idx for idx, task in enumerate(tasks)}
+        blockers = [
+            [position[dep] for dep in set(dependencies) if dep in position]
+            for _, _, dependencies in tasks
+        ]
+
+        engineers = np.empty(len(tasks), dtype=np.int32)
+        for idx in _topological_order(blockers):
+            engineers[idx] = self.schedule_task(*tasks[idx])
+        return engineers
+
+    def schedule_tasks_soa(
+        self, names: List[str], durations: np.ndarray, dependencies: List[np.ndarray]
+    ) -> np.ndarray:
+        """
+        Schedule a batch given as parallel arrays, in dependency order
+
+        Like schedule_tasks, but dependencies are positions within the batch,
+        so no task names are looked up.
+
+        Args:
+            names: Task name per task
+            durations: Duration in days per task
+            dependencies: Integer array of the batch positions each task depends on
+
+        Returns:
+            Engineer index assigned to each task, aligned with names
+
+        Raises:
+            ValueError: If the arrays differ in length, a duration is negative or
+                NaN, a dependency position is out of range, or the batch has a
+                dependency cycle
+        """
+        durations = np.asarray(durations, dtype=np.float64)
+        if durations.shape != (len(names),) or len(dependencies) != len(names):
+            raise ValueError(
+                f"Expected {len(names)} durations and dependency arrays, "
+                f"got {durations.size} and {len(dependencies)}"
+            )
+        invalid = np.flatnonzero(~(durations >= 0))
+        if invalid.size:
+            self._check_duration(names[invalid[0]], float(durations[invalid[0]]))
+
+        blockers = [np.asarray(deps, dtype=np.int64).tolist() for deps in dependencies]
+        for idx, task_blockers in enumerate(blockers):
+            if task_blockers and not 0 <= min(task_blockers) <= max(task_blockers) < len(names):
+                raise ValueError(f"Dependency position out of range for task {names[idx]}")
+
+        rows = [0] * len(names)
+        engineers = np.empty(len(names), dtype=np.int32)
+        duration_list = durations.tolist()
+        for idx in _topological_order(blockers):
+            engineers[idx] = self._place_task(
+                names[idx], duration_list[idx], [rows[dep] for dep in blockers[idx]]
+            )
+            rows[idx] = len(self.task_names) - 1
+        return engineers
+
+    def compute_critical_path(self, jit: bool = False) -> List[str]:
+        """
+        Find the dependency chain of scheduled tasks with the longest total duration
+
+        A task only waits on tasks scheduled before it, so scheduling order is
+        already topological and one linear sweep over the rows suffices.
+        Engineer availability is ignored: this is the lower bound on duration.
+
+        Args:
+            jit: Run the sweep in the numba-compiled scheduler_kernel (requires numba)
+
+        Returns:
+            Task names along the critical path, first task first
+        """
+        if jit:
+            from scheduler_kernel import longest_chain
+
+            longest_by_row, previous_by_row = longest_chain(
+                self.task_duration, self.dependency_indptr, self.dependency_indices
+            )
+            longest: List[float] = longest_by_row.tolist()
+            previous: List[int] = previous_by_row.tolist()
+        else:
+            durations = self.task_duration.tolist()
+            longest = [0.0] * len(durations)
+            previous = [-1] * len(durations)
+            for row, dependency_rows in enumerate(self.task_dependency_rows):
+                for dep in dependency_rows:
+                    if previous[row] == -1 or longest[dep] > longest[previous[row]]:
+                        previous[row] = dep
+                upstream = longest[previous[row]] if previous[row] != -1 else 0.0
+                longest[row] = upstream + durations[row]
+
+        if not longest:
+            return []
+        row = max(range(len(longest)), key=longest.__getitem__)
+        path = [row]
+        while previous[row] != -1:
+            row = previous[row]
+            path.append(row)
+        return [self.task_names[row] for row in reversed(path)]
+
     def get_project_duration(self) -> float:
         """Get total project duration in days"""
-        return max(self.engineer_end_times) if self.engineer_end_times else 0
+        return self._project_duration
 
-    def get_engineer_utilization(self) -> List[float]:
-        """Get utilization percentage for each engineer"""
+    def get_engineer_utilization(self) -> np.ndarray:
+        """Get utilization percentage for each engineer (all zero for an empty schedule)"""
         total_duration = self.get_project_duration()
-        if total_duration == 0:
-            return [0.0] * self.num_engineers
-
-        return [
-            (self.engineer_end_times[i] / total_duration) * 100 for i in range(self.num_engineers)
-        ]
+        return np.divide(
+            self.engineer_end_times * 100.0,
+            total_duration,
+            out=np.zeros(self.num_engineers, dtype=np.float64),
+            where=total_duration > 0,
+        )
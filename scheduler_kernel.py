@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled helpers for TaskScheduler.
+
+Scheduled tasks are identified by their row: a task can only depend on rows
+scheduled before it, so row order is topological. Dependencies are a CSR
+adjacency indexed by row.
+
+Importing this module requires numba (pip install project-management[fast]);
+TaskScheduler imports it only when asked to.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def longest_chain(
+    durations: np.ndarray, dependency_indptr: np.ndarray, dependency_indices: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the longest dependency chain ending at each scheduled task.
+
+    Args:
+        durations: Duration per row
+        dependency_indptr: CSR row pointers of the rows each row depends on
+        dependency_indices: CSR rows each row depends on
+
+    Returns:
+        Tuple of the longest chain duration ending at each row and the previous
+        row on that chain (-1 where the chain starts); ties keep the first
+        dependency listed
+    """
+    n = durations.shape[0]
+    longest = np.empty(n, dtype=np.float64)
+    previous = np.full(n, -1, dtype=np.int64)
+    for row in range(n):
+        upstream = 0.0
+        for j in range(dependency_indptr[row], dependency_indptr[row + 1]):
+            dep = dependency_indices[j]
+            if previous[row] == -1 or longest[dep] > upstream:
+                previous[row] = dep
+                upstream = longest[dep]
+        longest[row] = upstream + durations[row]
+    return longest, previous
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled discrete event simulation kernel for the Monte Carlo timeline estimate.
+
+Runs a whole batch of simulation runs in native code, in parallel across runs.
+It mirrors EpicAnalyzer._simulate_schedule on plain integer arrays:
+- Tickets are identified by their priority rank (lower rank is picked first)
+- Dependents and epic membership are CSR adjacency arrays indexed by rank
+- The ready queue and in-progress set are binary min-heaps in int64 arrays
+
+Importing this module requires numba (pip install project-management[fast]);
+epic_timeline_estimator imports it lazily and falls back to pure Python.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _heap_push(heap: np.ndarray, size: int, value: int) -> int:
+    """Push value onto the min-heap stored in heap[:size] and return the new size."""
+    pos = size
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if heap[parent] <= value:
+            break
+        heap[pos] = heap[parent]
+        pos = parent
+    heap[pos] = value
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap: np.ndarray, size: int) -> Tuple[int, int]:
+    """Pop the smallest value off the min-heap in heap[:size]; return it and the new size."""
+    top = heap[0]
+    size -= 1
+    last = heap[size]
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[child] >= last:
+            break
+        heap[pos] = heap[child]
+        pos = child
+    heap[pos] = last
+    return top, size
+
+
+@njit(cache=True)
+def _simulate_run(
+    workdays: np.ndarray,
+    num_engineers: int,
+    dependents_indptr: np.ndarray,
+    dependents_indices: np.ndarray,
+    unmet_blockers: np.ndarray,
+    epic_indptr: np.ndarray,
+    epic_indices: np.ndarray,
+    epic_pending: np.ndarray,
+    max_workdays: int,
+    epic_days: np.ndarray,
+) -> int:
+    """Simulate one run, fill epic_days (-1 = never completes) and return its completion day."""
+    n = workdays.shape[0]
+    unmet = unmet_blockers.copy()
+    pending = epic_pending.copy()
+
+    # Ranks are pushed in increasing order, which already satisfies the heap property
+    ready = np.empty(n, dtype=np.int64)
+    ready_size = 0
+    for rank in range(n):
+        if unmet[rank] == 0:
+            ready[ready_size] = rank
+            ready_size += 1
+
+    # Claimed tickets keyed by completion workday, then rank: finish_day * n + rank
+    in_progress = np.empty(n, dtype=np.int64)
+    in_progress_size = 0
+
+    for epic in range(pending.shape[0]):
+        epic_days[epic] = 1 if pending[epic] == 0 else -1
+
+    idle_engineers = num_engineers
+    remaining_count = n
+    workday = 1
+    while True:
+        while idle_engineers > 0 and ready_size > 0:
+            rank, ready_size = _heap_pop(ready, ready_size)
+            finish_day = workday + workdays[rank] - 1
+            in_progress_size = _heap_push(in_progress, in_progress_size, finish_day * n + rank)
+            idle_engineers -= 1
+
+        if in_progress_size == 0 or in_progress[0] // n > max_workdays:
+            break
+
+        workday = int(in_progress[0] // n)
+        while in_progress_size > 0 and in_progress[0] // n == workday:
+            item, in_progress_size = _heap_pop(in_progress, in_progress_size)
+            rank = item - workday * n
+            idle_engineers += 1
+            remaining_count -= 1
+
+            for j in range(dependents_indptr[rank], dependents_indptr[rank + 1]):
+                dependent = dependents_indices[j]
+                unmet[dependent] -= 1
+                if unmet[dependent] == 0:
+                    ready_size = _heap_push(ready, ready_size, dependent)
+
+            for j in range(epic_indptr[rank], epic_indptr[rank + 1]):
+                epic = epic_indices[j]
+                pending[epic] -= 1
+                if pending[epic] == 0:
+                    epic_days[epic] = workday
+
+        if remaining_count == 0:
+            return workday
+        workday += 1
+
+    return max_workdays
+
+
+@njit(parallel=True, cache=True)
+def simulate_batch(
+    workdays: np.ndarray,
+    num_engineers: int,
+    dependents_indptr: np.ndarray,
+    dependents_indices: np.ndarray,
+    unmet_blockers: np.ndarray,
+    epic_indptr: np.ndarray,
+    epic_indices: np.ndarray,
+    epic_pending: np.ndarray,
+    max_workdays: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate a batch of Monte Carlo runs in parallel.
+
+    Args:
+        workdays: (runs, tickets) int64 workdays per ticket, columns in priority order
+        num_engineers: Engineers picking up tickets
+        dependents_indptr: CSR row pointers of the tickets each rank unblocks
+        dependents_indices: CSR ranks of the tickets each rank unblocks
+        unmet_blockers: Unresolved blocker count per rank at the start of a run
+        epic_indptr: CSR row pointers of the epics each rank belongs to
+        epic_indices: CSR epic indices of the epics each rank belongs to
+        epic_pending: Outstanding ticket count per epic at the start of a run
+        max_workdays: Safety limit on simulated workdays
+
+    Returns:
+        Tuple of completion workday per run and (runs, epics) epic completion
+        workdays, with -1 for epics that never complete
+    """
+    runs = workdays.shape[0]
+    completion_days = np.empty(runs, dtype=np.int64)
+    epic_days = np.empty((runs, epic_pending.shape[0]), dtype=np.int64)
+    for run in prange(runs):
+        completion_days[run] = _simulate_run(
+            workdays[run],
+            num_engineers,
+            dependents_indptr,
+            dependents_indices,
+            unmet_blockers,
+            epic_indptr,
+            epic_indices,
+            epic_pending,
+            max_workdays,
+            epic_days[run],
+        )
+    return completion_days, epic_days
@@ -1,7 +1,11 @@
 """Pytest configuration and fixtures."""
 
+from typing import Dict
+
 import pytest
 
+from scheduler import TaskScheduler
+
 
 @pytest.fixture
 def sample_jira_issues():
@@ -45,3 +49,44 @@ def sample_jira_issues():
             },
         },
     ]
+
+
+# Pooled schedulers that held more tasks than this are dropped after the test, so
+# their grown columns don't stay alive for the rest of the session
+MAX_POOLED_TASKS = 1024
+
+
+@pytest.fixture(scope="session")
+def _scheduler_pool():
+    """Schedulers reused across the session, one per team size."""
+    pool: Dict[int, TaskScheduler] = {}
+    return pool
+
+
+@pytest.fixture
+def make_scheduler(_scheduler_pool):
+    """
+    Return a factory handing out a pooled, freshly reset scheduler with n engineers.
+
+    Every call within one test returns a distinct scheduler: asking again for a
+    team size already handed out gives a new, unpooled TaskScheduler instead of
+    resetting the first one.
+    """
+    handed_out: Dict[int, TaskScheduler] = {}
+
+    def _make(num_engineers):
+        if num_engineers in handed_out:
+            return TaskScheduler(num_engineers)
+        scheduler = _scheduler_pool.get(num_engineers)
+        if scheduler is None:
+            scheduler = _scheduler_pool[num_engineers] = TaskScheduler(num_engineers)
+        else:
+            scheduler.reset()
+        handed_out[num_engineers] = scheduler
+        return scheduler
+
+    yield _make
+
+    for num_engineers, scheduler in handed_out.items():
+        if len(scheduler.task_names) > MAX_POOLED_TASKS:
+            del _scheduler_pool[num_engineers]
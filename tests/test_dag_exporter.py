@@ -0,0 +1,22 @@
+"""Tests for dag_exporter module."""
+
+from dag_exporter import _export_dot_only
+from issue_parser import Issue
+
+
+def test_export_dot_only_writes_nodes_and_edges(tmp_path):
+    """Test the DOT fallback writes every node and only in-scope edges."""
+    a = Issue("A-1", "First", "To Do", 3.0)
+    b = Issue("A-2", "Second", "Done", 5.0)
+    a.blocks = ["A-2", "OUT-1"]
+    issues = {"A-1": a, "A-2": b}
+    path = tmp_path / "epic.dot"
+
+    _export_dot_only(issues, str(path))
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "digraph EpicDependencies {"
+    assert lines[-1] == "}"
+    assert '  "A-1" [label="A-1\\n3.0 pts\\nTo Do", style=filled, fillcolor=lightblue];' in lines
+    assert '  "A-2" [label="A-2\\n5.0 pts\\nDone", style=filled, fillcolor=lightgreen];' in lines
+    assert [line for line in lines if "->" in line] == ['  "A-1" -> "A-2";']
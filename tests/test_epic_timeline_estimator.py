@@ -1,21 +1,39 @@
 """Tests for epic_timeline_estimator module."""
 
 import random
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from epic_timeline_estimator import EpicAnalyzer, add_workdays
+import epic_timeline_estimator
+from epic_timeline_estimator import (
+    MAX_WORKDAYS,
+    VARIANCE_DRAW_BATCH,
+    EpicAnalyzer,
+    add_workdays,
+    add_workdays_array,
+    simulate_chunk,
+    work_to_workdays,
+    workday_percentiles,
+)
 from issue_parser import Issue
 
 # ---- Fixtures ----
 
 
+@pytest.fixture(scope="session")
+def _jira_mock():
+    """One mock Jira client shared by every analyzer; reset before each use."""
+    return MagicMock()
+
+
 @pytest.fixture
-def analyzer():
+def analyzer(_jira_mock):
     """Create an EpicAnalyzer with a mock Jira client."""
-    return EpicAnalyzer(MagicMock())
+    _jira_mock.reset_mock(return_value=True, side_effect=True)
+    return EpicAnalyzer(_jira_mock)
 
 
 def _make_issue(key, points, status="To Do", epic_key=None):
@@ -45,6 +63,29 @@ def _setup_analyzer(analyzer, issues_dict, epic_keys=None):
     analyzer.epic_keys = epic_keys
 
 
+# Shared read-only topologies: the simulator never mutates issues, and _setup_analyzer
+# only (re)assigns their epic, so these are built once per module
+
+
+@pytest.fixture(scope="module")
+def single_10pt_issue():
+    """One 10pt ticket."""
+    return (_make_issue("T-1", 10.0),)
+
+
+@pytest.fixture(scope="module")
+def chain3_3pt_issues():
+    """T-1 -> T-2 -> T-3, 3pts each."""
+    a = _make_issue("T-1", 3.0)
+    b = _make_issue("T-2", 3.0)
+    c = _make_issue("T-3", 3.0)
+    a.blocks = ["T-2"]
+    b.blocked_by = ["T-1"]
+    b.blocks = ["T-3"]
+    c.blocked_by = ["T-2"]
+    return (a, b, c)
+
+
 # ---- _compute_team_efficiency tests ----
 
 
@@ -104,24 +145,14 @@ class TestSimulateWorkdays:
         assert result["completion_day"] == 0
         assert result["epic_completion_days"]["E-1"] == 0
 
-    def test_single_issue_one_dev(self, analyzer):
-        """Single 5pt issue, 1 dev at 1pt/day = 5 days."""
-        issue = _make_issue("T-1", 5.0)
-        _setup_analyzer(analyzer, {"E-1": [issue]})
-
-        result = analyzer._simulate_workdays_for_run(
-            developers=1,
-            points_per_sprint_per_dev=5,
-            sprint_weeks=1,
-            coordination_factor=0.0,
-            variance=0.0,
-        )
-        assert result["completion_day"] == 5
-        assert result["epic_completion_days"]["E-1"] == 5
-
-    def test_single_1pt_issue(self, analyzer):
-        """Single 1pt issue should complete in 1 day with sufficient capacity."""
-        issue = _make_issue("T-1", 1.0)
+    @pytest.mark.parametrize(
+        "points,expected_day",
+        [(5.0, 5), (1.0, 1), (0.0, 1)],
+        ids=["5pt-one-dev", "1pt", "0pt-completes-day-1"],
+    )
+    def test_single_issue(self, analyzer, points, expected_day):
+        """A lone ticket at 1pt/day takes ceil(points) days, and at least one."""
+        issue = _make_issue("T-1", points)
         _setup_analyzer(analyzer, {"E-1": [issue]})
 
         result = analyzer._simulate_workdays_for_run(
@@ -131,60 +162,50 @@ class TestSimulateWorkdays:
             coordination_factor=0.0,
             variance=0.0,
         )
-        assert result["completion_day"] == 1
-
-    def test_parallel_independent_issues(self, analyzer):
-        """Two independent 5pt issues, 2 devs = 5 days (parallel)."""
-        a = _make_issue("T-1", 5.0)
-        b = _make_issue("T-2", 5.0)
-        _setup_analyzer(analyzer, {"E-1": [a, b]})
-
-        result = analyzer._simulate_workdays_for_run(
-            developers=2,
-            points_per_sprint_per_dev=5,
-            sprint_weeks=1,
-            coordination_factor=0.0,
-            variance=0.0,
-        )
-        assert result["completion_day"] == 5
+        assert result["completion_day"] == expected_day
+        assert result["epic_completion_days"]["E-1"] == expected_day
 
-    def test_sequential_dependency_chain(self, analyzer):
-        """A->B->C chain, each 3pts, 1 dev at 1pt/day = 9 days sequential."""
-        a = _make_issue("T-1", 3.0)
-        b = _make_issue("T-2", 3.0)
-        c = _make_issue("T-3", 3.0)
-        a.blocks = {"T-2"}
-        b.blocked_by = {"T-1"}
-        b.blocks = {"T-3"}
-        c.blocked_by = {"T-2"}
-        _setup_analyzer(analyzer, {"E-1": [a, b, c]})
+    @pytest.mark.parametrize(
+        "points,developers,expected_day",
+        [(5.0, 2, 5), (5.0, 1.5, 5), (3.0, 2, 3)],
+        ids=["two-devs", "fractional-devs-ceiled", "discrete-claims"],
+    )
+    def test_parallel_independent_issues(self, analyzer, points, developers, expected_day):
+        """Two independent tickets, each claimed by its own engineer, run in parallel."""
+        issues = [_make_issue("T-1", points), _make_issue("T-2", points)]
+        _setup_analyzer(analyzer, {"E-1": issues})
 
+        # Fractional developers are ceiled for headcount: 1.5 devs -> 2 engineers
         result = analyzer._simulate_workdays_for_run(
-            developers=1,
+            developers=developers,
             points_per_sprint_per_dev=5,
             sprint_weeks=1,
             coordination_factor=0.0,
             variance=0.0,
         )
-        assert result["completion_day"] == 9
+        assert result["completion_day"] == expected_day
 
-    def test_sequential_chain_extra_devs_dont_help(self, analyzer):
-        """A->B chain, extra devs can't parallelize sequential work."""
-        a = _make_issue("T-1", 5.0)
-        b = _make_issue("T-2", 5.0)
-        a.blocks = {"T-2"}
-        b.blocked_by = {"T-1"}
-        _setup_analyzer(analyzer, {"E-1": [a, b]})
+    @pytest.mark.parametrize(
+        "length,points,developers,expected_day",
+        [(3, 3.0, 1, 9), (2, 5.0, 5, 10)],
+        ids=["chain3-one-dev", "chain2-extra-devs-dont-help"],
+    )
+    def test_sequential_dependency_chain(self, analyzer, length, points, developers, expected_day):
+        """A dependency chain runs sequentially however many engineers there are."""
+        chain = [_make_issue(f"T-{i}", points) for i in range(1, length + 1)]
+        for blocker, blocked in zip(chain, chain[1:]):
+            blocker.blocks = [blocked.key]
+            blocked.blocked_by = [blocker.key]
+        _setup_analyzer(analyzer, {"E-1": chain})
 
         result = analyzer._simulate_workdays_for_run(
-            developers=5,
+            developers=developers,
             points_per_sprint_per_dev=5,
             sprint_weeks=1,
             coordination_factor=0.0,
             variance=0.0,
         )
-        # Must be sequential: 5 + 5 = 10 days
-        assert result["completion_day"] == 10
+        assert result["completion_day"] == expected_day
 
     def test_multi_epic_completion_tracking(self, analyzer):
         """Each epic's completion day is tracked independently."""
@@ -208,8 +229,8 @@ class TestSimulateWorkdays:
         # A-1 blocks A-2 (1 descendant), so A-1 has priority
         a1 = _make_issue("A-1", 5.0)
         a2 = _make_issue("A-2", 5.0)
-        a1.blocks = {"A-2"}
-        a2.blocked_by = {"A-1"}
+        a1.blocks = ["A-2"]
+        a2.blocked_by = ["A-1"]
 
         # B-1 is a leaf (0 descendants)
         b1 = _make_issue("B-1", 1.0)
@@ -234,9 +255,9 @@ class TestSimulateWorkdays:
         a1 = _make_issue("A-1", 1.0)
         a2 = _make_issue("A-2", 1.0)
         a3 = _make_issue("A-3", 1.0)
-        a1.blocks = {"A-2", "A-3"}
-        a2.blocked_by = {"A-1"}
-        a3.blocked_by = {"A-1"}
+        a1.blocks = ["A-2", "A-3"]
+        a2.blocked_by = ["A-1"]
+        a3.blocked_by = ["A-1"]
 
         # B-1 is independent (0 descendants)
         b1 = _make_issue("B-1", 1.0)
@@ -253,10 +274,9 @@ class TestSimulateWorkdays:
         # With 1 dev: A-1 first (blocker), then A-2, A-3, B-1 in some order = 4 days
         assert result["completion_day"] == 4
 
-    def test_brooks_law_applied(self, analyzer):
+    def test_brooks_law_applied(self, analyzer, single_10pt_issue):
         """Brooks's Law reduces effective capacity, increasing completion time."""
-        issue = _make_issue("T-1", 10.0)
-        _setup_analyzer(analyzer, {"E-1": [issue]})
+        _setup_analyzer(analyzer, {"E-1": single_10pt_issue})
 
         # Without Brooks's Law
         result_no_brooks = analyzer._simulate_workdays_for_run(
@@ -279,50 +299,59 @@ class TestSimulateWorkdays:
         # With Brooks's Law, each dev is less efficient, so it takes longer
         assert result_with_brooks["completion_day"] >= result_no_brooks["completion_day"]
 
-    def test_variance_affects_results(self, analyzer):
+    def test_variance_affects_results(self, analyzer, single_10pt_issue):
         """Non-zero variance should produce different results across runs."""
-        issue = _make_issue("T-1", 10.0)
-        _setup_analyzer(analyzer, {"E-1": [issue]})
+        _setup_analyzer(analyzer, {"E-1": single_10pt_issue})
 
-        results = set()
-        for seed in range(50):
-            random.seed(seed)
-            result = analyzer._simulate_workdays_for_run(
-                developers=1,
-                points_per_sprint_per_dev=5,
-                sprint_weeks=1,
-                coordination_factor=0.0,
-                variance=0.30,
-            )
-            results.add(result["completion_day"])
+        results = analyzer._simulate_workdays_batch_seeded(
+            np.arange(50),
+            developers=1,
+            points_per_sprint_per_dev=5,
+            sprint_weeks=1,
+            coordination_factor=0.0,
+            variance=0.30,
+        )
 
         # With high variance, we should see at least 2 different outcomes
-        assert len(results) > 1
+        assert np.unique(results).size > 1
 
-    def test_zero_variance_deterministic(self, analyzer):
+    def test_zero_variance_deterministic(self, analyzer, single_10pt_issue):
         """Zero variance should produce identical results every run."""
-        issue = _make_issue("T-1", 10.0)
-        _setup_analyzer(analyzer, {"E-1": [issue]})
+        _setup_analyzer(analyzer, {"E-1": single_10pt_issue})
 
-        results = set()
-        for seed in range(20):
-            random.seed(seed)
-            result = analyzer._simulate_workdays_for_run(
-                developers=1,
-                points_per_sprint_per_dev=5,
-                sprint_weeks=1,
-                coordination_factor=0.0,
-                variance=0.0,
-            )
-            results.add(result["completion_day"])
+        results = analyzer._simulate_workdays_batch_seeded(
+            np.arange(20),
+            developers=1,
+            points_per_sprint_per_dev=5,
+            sprint_weeks=1,
+            coordination_factor=0.0,
+            variance=0.0,
+        )
+
+        assert np.unique(results).tolist() == [10]
 
-        assert len(results) == 1
-        assert results.pop() == 10
+    def test_seeded_batch_matches_seeded_single_runs(self, analyzer, chain3_3pt_issues):
+        """Each seeded batch row equals a single run driven by the same seed."""
+        extra = _make_issue("T-9", 4.0)
+        _setup_analyzer(analyzer, {"E-1": [*chain3_3pt_issues, extra]})
+        params = {
+            "developers": 2,
+            "points_per_sprint_per_dev": 5,
+            "sprint_weeks": 1,
+            "coordination_factor": 0.15,
+            "variance": 0.3,
+        }
 
-    def test_sprint_weeks_affects_capacity(self, analyzer):
+        results = analyzer._simulate_workdays_batch_seeded(np.arange(10), **params)
+
+        for seed, completion_day in enumerate(results.tolist()):
+            analyzer._rng = np.random.default_rng(seed)
+            expected = analyzer._simulate_workdays_for_run(**params)
+            assert completion_day == expected["completion_day"]
+
+    def test_sprint_weeks_affects_capacity(self, analyzer, single_10pt_issue):
         """Longer sprints spread the same points over more days."""
-        issue = _make_issue("T-1", 10.0)
-        _setup_analyzer(analyzer, {"E-1": [issue]})
+        _setup_analyzer(analyzer, {"E-1": single_10pt_issue})
 
         # 1-week sprint: 5pts/5days = 1pt/day → 10 days
         result_1w = analyzer._simulate_workdays_for_run(
@@ -345,29 +374,12 @@ class TestSimulateWorkdays:
         assert result_1w["completion_day"] == 10
         assert result_2w["completion_day"] == 20
 
-    def test_fractional_developers_ceiling(self, analyzer):
-        """Fractional developers are ceiled for headcount."""
-        a = _make_issue("T-1", 5.0)
-        b = _make_issue("T-2", 5.0)
-        _setup_analyzer(analyzer, {"E-1": [a, b]})
-
-        # 1.5 devs → ceil(1.5) = 2 engineers, both work in parallel
-        result = analyzer._simulate_workdays_for_run(
-            developers=1.5,
-            points_per_sprint_per_dev=5,
-            sprint_weeks=1,
-            coordination_factor=0.0,
-            variance=0.0,
-        )
-        # 2 engineers work in parallel at 1pt/day each
-        assert result["completion_day"] == 5
-
     def test_already_complete_deps_satisfied(self, analyzer):
         """Issues blocked by already-complete issues should be available immediately."""
         done = _make_issue("T-1", 3.0, status="Done")
         blocked = _make_issue("T-2", 5.0)
-        blocked.blocked_by = {"T-1"}
-        done.blocks = {"T-2"}
+        blocked.blocked_by = ["T-1"]
+        done.blocks = ["T-2"]
         _setup_analyzer(analyzer, {"E-1": [done, blocked]})
 
         result = analyzer._simulate_workdays_for_run(
@@ -384,7 +396,7 @@ class TestSimulateWorkdays:
         """Dependencies on issues outside the tracked set don't block forever."""
         issue = _make_issue("T-1", 5.0)
         # Blocked by an issue not in analyzer.issues
-        issue.blocked_by = {"EXTERNAL-1"}
+        issue.blocked_by = ["EXTERNAL-1"]
         _setup_analyzer(analyzer, {"E-1": [issue]})
 
         # EXTERNAL-1 is not in completed_in_sim, so T-1 stays blocked
@@ -399,37 +411,6 @@ class TestSimulateWorkdays:
         # T-1 will be stuck at max_workdays since its dep is never resolved
         assert result["completion_day"] == 365 * 2
 
-    def test_engineers_claim_discrete_tickets(self, analyzer):
-        """Each engineer works on exactly one ticket at a time, no sharing."""
-        a = _make_issue("T-1", 3.0)
-        b = _make_issue("T-2", 3.0)
-        _setup_analyzer(analyzer, {"E-1": [a, b]})
-
-        # 2 engineers, each claims a separate ticket
-        result = analyzer._simulate_workdays_for_run(
-            developers=2,
-            points_per_sprint_per_dev=5,
-            sprint_weeks=1,
-            coordination_factor=0.0,
-            variance=0.0,
-        )
-        # Both work in parallel: 3 days
-        assert result["completion_day"] == 3
-
-    def test_zero_point_issue_completes_immediately(self, analyzer):
-        """A 0-point issue should complete on day 1."""
-        issue = _make_issue("T-1", 0.0)
-        _setup_analyzer(analyzer, {"E-1": [issue]})
-
-        result = analyzer._simulate_workdays_for_run(
-            developers=1,
-            points_per_sprint_per_dev=5,
-            sprint_weeks=1,
-            coordination_factor=0.0,
-            variance=0.0,
-        )
-        assert result["completion_day"] == 1
-
     def test_mixed_complete_and_incomplete(self, analyzer):
         """Mix of done and to-do issues; only incomplete count for completion."""
         done1 = _make_issue("T-1", 5.0, status="Done")
@@ -447,6 +428,30 @@ class TestSimulateWorkdays:
         assert result["completion_day"] == 2
 
 
+# ---- work_to_workdays tests ----
+
+
+class TestWorkToWorkdays:
+    def test_whole_days_rounded_up(self):
+        """Partial days of work take a whole workday."""
+        days = work_to_workdays(np.array([1.0, 2.5, 3.0]), 1.0)
+        assert days.tolist() == [1, 3, 3]
+
+    def test_empty_ticket_takes_one_day(self):
+        """Zero-point tickets still occupy an engineer for a day."""
+        assert work_to_workdays(np.array([0.0]), 1.0).tolist() == [1]
+
+    def test_tolerance_absorbs_float_error(self):
+        """Work a hair over a whole number of days does not spill into another day."""
+        assert work_to_workdays(np.array([1.0]), 1.0 / 3.0).tolist() == [3]
+        assert work_to_workdays(np.array([3.0005]), 1.0).tolist() == [3]
+
+    def test_no_capacity_never_finishes(self):
+        """Without capacity only empty tickets complete."""
+        days = work_to_workdays(np.array([0.0, 5.0]), 0.0)
+        assert days.tolist() == [1, MAX_WORKDAYS + 1]
+
+
 # ---- get_epic_issues tests ----
 
 
@@ -464,6 +469,50 @@ class TestGetEpicIssues:
         analyzer.issues_by_epic = {}
         assert analyzer.get_epic_issues("NOPE") == {}
 
+    def test_fetch_requests_only_used_fields(self, analyzer):
+        analyzer.jira.search_jql.return_value = [
+            {"key": "A-1", "fields": {"summary": "A", "status": {"name": "To Do"}}}
+        ]
+
+        analyzer.fetch_multi_epic_issues(["E-1"])
+
+        jql, fields = analyzer.jira.search_jql.call_args.args
+        assert jql == "parent = E-1"
+        assert fields == ["summary", "status", "customfield_10115", "issuelinks"]
+        assert list(analyzer.get_epic_issues("E-1")) == ["A-1"]
+
+    def test_fetch_multiple_epics_concurrently_keeps_order(self, analyzer):
+        """Concurrent epic searches still land under the right epic, in epic order."""
+
+        def search(jql, fields, max_results):
+            epic = jql.split("= ")[1]
+            key = f"{epic}-T"
+            return [{"key": key, "fields": {"summary": key, "status": {"name": "To Do"}}}]
+
+        analyzer.jira.search_jql.side_effect = search
+
+        analyzer.fetch_multi_epic_issues(["E-1", "E-2", "E-3"])
+
+        assert analyzer.jira.search_jql.call_count == 3
+        assert list(analyzer.issues_by_epic) == ["E-1", "E-2", "E-3"]
+        assert list(analyzer.get_epic_issues("E-2")) == ["E-2-T"]
+        assert analyzer.issues["E-3-T"].epic_key == "E-3"
+
+
+# ---- workday_percentiles tests ----
+
+
+class TestWorkdayPercentiles:
+    def test_matches_sorted_index(self):
+        """Percentile q is the sorted result at index int(n * q)."""
+        results = [random.randint(1, 200) for _ in range(1001)]
+        expected = [sorted(results)[int(len(results) * q)] for q in (0.50, 0.85, 0.95)]
+        assert workday_percentiles(results) == expected
+
+    def test_empty_results_are_zero(self):
+        """Epics without simulated completions report zero workdays."""
+        assert workday_percentiles([]) == [0, 0, 0]
+
 
 # ---- estimate_timeline tests ----
 
@@ -546,6 +595,28 @@ class TestEstimateTimeline:
         assert result["epic_summaries"]["E-1"]["total_points"] == 5.0
         assert result["epic_summaries"]["E-2"]["total_points"] == 3.0
 
+    def test_critical_path_detail_printed(self, analyzer, capsys):
+        """Critical path details are captured in the result and printed without the issue map."""
+        a = _make_issue("T-1", 5.0)
+        a.summary = "Build the thing"
+        _setup_analyzer(analyzer, {"E-1": [a]})
+
+        result = analyzer.estimate_timeline(
+            epic_keys=["E-1"],
+            developers=1,
+            points_per_sprint_per_dev=5,
+            sprint_weeks=1,
+            simulations=10,
+            variance=0.0,
+        )
+
+        assert result["critical_path_detail"] == [
+            {"key": "T-1", "summary": "Build the thing", "story_points": 5.0, "epic_key": "E-1"}
+        ]
+        analyzer.issues = {}
+        analyzer.print_summary(result)
+        assert "T-1: Build the thing (5.0 pts) [E-1]" in capsys.readouterr().out
+
     def test_completed_points_tracked(self, analyzer):
         """Completed points are tracked separately."""
         done = _make_issue("T-1", 5.0, status="Done")
@@ -566,6 +637,171 @@ class TestEstimateTimeline:
         assert result["completed_issues"] == 1
         assert result["remaining_issues"] == 1
 
+    def test_zero_variance_simulates_once(self, analyzer):
+        """Zero variance runs the simulator once and replicates the result."""
+        issue = _make_issue("T-1", 5.0)
+        _setup_analyzer(analyzer, {"E-1": [issue]})
+        analyzer._simulate_workdays_batch = MagicMock(wraps=analyzer._simulate_workdays_batch)
+
+        result = analyzer.estimate_timeline(
+            epic_keys=["E-1"],
+            developers=1,
+            points_per_sprint_per_dev=5,
+            sprint_weeks=1,
+            simulations=1000,
+            variance=0.0,
+        )
+
+        assert analyzer._simulate_workdays_batch.call_count == 1
+        assert analyzer._simulate_workdays_batch.call_args.args[0].shape == (1, 1)
+        assert result["p50_workdays"] == result["p95_workdays"] == 5
+        assert result["epic_summaries"]["E-1"]["p95_end_date"] == result["p95_end_date"]
+
+    def test_sample_workdays_batch_matches_single_run_quantization(self, analyzer):
+        """Batch-sampled workdays use the same quantization as a single run."""
+        blocked = _make_issue("T-1", 5.0)
+        blocker = _make_issue("T-2", 2.0)
+        blocker.blocks.append("T-1")
+        blocked.blocked_by.append("T-2")
+        _setup_analyzer(analyzer, {"E-1": [blocked, blocker]})
+
+        workdays = analyzer._sample_workdays_batch(
+            runs=3, effective_capacity=1.0, variance=0.0, rng=np.random.default_rng(0)
+        )
+
+        assert workdays.shape == (3, 2)
+        # Columns are in priority order: T-2 unblocks T-1, so it comes first
+        assert workdays.tolist() == [[2, 5]] * 3
+
+    @pytest.mark.parametrize("num_engineers", [1, 2, 5])
+    def test_simulate_workdays_batch_matches_event_loop(self, analyzer, num_engineers):
+        """The NumPy lockstep batch reproduces every run of the per-run event loop."""
+        issues = [_make_issue(f"T-{i}", float(i % 5)) for i in range(12)]
+        for blocker, blocked in [(0, 3), (1, 3), (3, 7), (2, 8), (8, 9), (9, 11)]:
+            issues[blocker].blocks.append(issues[blocked].key)
+            issues[blocked].blocked_by.append(issues[blocker].key)
+        issues[5].status = "Done"
+        issues[5].is_complete = True
+        issues[10].blocked_by.append("EXT-1")  # never resolves
+        _setup_analyzer(analyzer, {"E-1": issues[:6], "E-2": issues[6:10], "E-3": issues[10:]})
+
+        workdays = analyzer._sample_workdays_batch(50, 0.5, 0.3, np.random.default_rng(7))
+        completion_days, epic_days = analyzer._simulate_workdays_batch(workdays, num_engineers)
+
+        epic_order = analyzer._index_epics()["epic_order"]
+        for run, row in enumerate(workdays.tolist()):
+            expected = analyzer._simulate_schedule(row, num_engineers)
+            assert completion_days[run] == expected["completion_day"]
+            for column, epic_key in enumerate(epic_order):
+                expected_day = expected["epic_completion_days"][epic_key]
+                assert epic_days[run, column] == (-1 if expected_day is None else expected_day)
+
+    def test_process_chunks_cover_every_run(self, analyzer):
+        """Runs split across worker processes are all collected, per epic too."""
+        issues = [_make_issue(f"T-{i}", 2.0) for i in range(1, 4)]
+        _setup_analyzer(analyzer, {"E-1": issues})
+        runs = 2 * VARIANCE_DRAW_BATCH + 30
+
+        workday_results, epic_results = analyzer._run_simulations_in_processes(
+            workers=2,
+            runs=runs,
+            epic_keys=["E-1"],
+            effective_capacity=1.0,
+            variance=0.1,
+            num_engineers=1,
+            block_seeds=analyzer._spawn_block_seeds(runs),
+        )
+
+        assert len(workday_results) == runs
+        assert epic_results["E-1"] == workday_results
+        assert all(3 <= day <= 12 for day in workday_results)
+
+    def test_simulate_chunk_is_reproducible(self, analyzer):
+        """A worker chunk is fully determined by its seed."""
+        _setup_analyzer(analyzer, {"E-1": [_make_issue("T-1", 5.0), _make_issue("T-2", 3.0)]})
+        args = (analyzer.issues, analyzer.issues_by_epic, analyzer.epic_keys, 20, ["E-1"])
+
+        first = simulate_chunk(*args, 1.0, 0.3, 1, [np.random.SeedSequence(42)])
+        second = simulate_chunk(*args, 1.0, 0.3, 1, [np.random.SeedSequence(42)])
+
+        assert first == second
+
+    def test_seed_makes_estimates_reproducible(self):
+        """Analyzers with the same seed produce identical Monte Carlo results."""
+        timelines = []
+        for _ in range(2):
+            analyzer = EpicAnalyzer(MagicMock(), seed=123)
+            issues = [_make_issue(f"T-{i}", float(i)) for i in range(1, 6)]
+            _setup_analyzer(analyzer, {"E-1": issues})
+            timelines.append(
+                analyzer.estimate_timeline(
+                    epic_keys=["E-1"],
+                    developers=2,
+                    points_per_sprint_per_dev=5,
+                    sprint_weeks=1,
+                    simulations=200,
+                    variance=0.3,
+                )
+            )
+
+        for key in ["p50_workdays", "p85_workdays", "p95_workdays", "epic_summaries"]:
+            assert timelines[0][key] == timelines[1][key]
+
+    def test_seeded_estimates_ignore_worker_count(self, monkeypatch):
+        """A seed gives the same estimates in one process, several, or the kernel."""
+        issues = [_make_issue(f"T-{i}", float(i)) for i in range(1, 6)]
+        params = {
+            "epic_keys": ["E-1"],
+            "developers": 2,
+            "points_per_sprint_per_dev": 5,
+            "sprint_weeks": 1,
+            "simulations": 3 * VARIANCE_DRAW_BATCH,
+            "variance": 0.3,
+        }
+
+        def estimate(workers):
+            analyzer = EpicAnalyzer(MagicMock(), seed=123)
+            _setup_analyzer(analyzer, {"E-1": issues})
+            return analyzer.estimate_timeline(workers=workers, **params)
+
+        # Kernel when numba is installed, otherwise the in-process batches
+        expected = estimate(workers=1)
+        monkeypatch.setattr(epic_timeline_estimator, "load_simulation_kernel", lambda: None)
+        monkeypatch.setattr(epic_timeline_estimator, "PARALLEL_MIN_RUNS", 1)
+        for workers in [1, 4]:
+            timeline = estimate(workers)
+            for key in ["p50_workdays", "p85_workdays", "p95_workdays", "epic_summaries"]:
+                assert timeline[key] == expected[key]
+
+    def test_missing_required_argument_raises(self, analyzer):
+        """Missing team parameters raise ValueError (also under python -O)."""
+        _setup_analyzer(analyzer, {"E-1": [_make_issue("T-1", 3.0)]})
+
+        with pytest.raises(ValueError, match="developers must be provided"):
+            analyzer.estimate_timeline(
+                epic_keys=["E-1"], points_per_sprint_per_dev=5, sprint_weeks=1
+            )
+
+    @pytest.mark.parametrize(
+        "override,message",
+        [
+            ({"simulations": 0}, "simulations must be at least 1"),
+            ({"variance": -0.1}, "variance must be non-negative"),
+        ],
+    )
+    def test_invalid_simulation_parameters_raise(self, analyzer, override, message):
+        """Invalid run counts and negative variance raise a clear ValueError."""
+        _setup_analyzer(analyzer, {"E-1": [_make_issue("T-1", 3.0)]})
+        params = {
+            "epic_keys": ["E-1"],
+            "developers": 1,
+            "points_per_sprint_per_dev": 5,
+            "sprint_weeks": 1,
+        }
+
+        with pytest.raises(ValueError, match=message):
+            analyzer.estimate_timeline(**params, **override)
+
     def test_end_dates_land_on_weekdays(self, analyzer):
         """All projected dates should land on weekdays (Mon-Fri)."""
         issues = [_make_issue(f"T-{i}", 3.0) for i in range(1, 6)]
@@ -580,14 +816,13 @@ class TestEstimateTimeline:
             variance=0.1,
         )
 
-        for date_key in ["p50_end_date", "p85_end_date", "p95_end_date"]:
-            d = datetime.strptime(result[date_key], "%Y-%m-%d")
-            assert d.weekday() < 5, f"{date_key} = {result[date_key]} is a weekend"
+        date_keys = ["p50_end_date", "p85_end_date", "p95_end_date"]
+        summaries = [result, *result["epic_summaries"].values()]
+        dates = np.array([summary[key] for summary in summaries for key in date_keys])
 
-        for epic_summary in result["epic_summaries"].values():
-            for date_key in ["p50_end_date", "p85_end_date", "p95_end_date"]:
-                d = datetime.strptime(epic_summary[date_key], "%Y-%m-%d")
-                assert d.weekday() < 5, f"Epic {date_key} = {epic_summary[date_key]} is a weekend"
+        # Parse all ISO dates at once; is_busday defaults to a Mon-Fri week
+        weekend = dates[~np.is_busday(dates.astype("datetime64[D]"))]
+        assert weekend.size == 0, f"Dates on a weekend: {weekend.tolist()}"
 
 
 # ---- add_workdays tests ----
@@ -640,3 +875,20 @@ class TestAddWorkdays:
         for days in range(1, 100):
             result = add_workdays(start, days)
             assert result.weekday() < 5, f"add_workdays({start}, {days}) = {result} (weekend!)"
+
+    def test_weekend_start_counts_from_friday(self):
+        """1 workday from Saturday or Sunday = Monday; 0 keeps the weekend date."""
+        saturday = datetime(2026, 2, 21)
+        sunday = datetime(2026, 2, 22)
+        assert add_workdays(saturday, 1) == datetime(2026, 2, 23)
+        assert add_workdays(sunday, 5) == datetime(2026, 2, 27)
+        assert add_workdays(sunday, 0) == sunday
+
+    def test_array_matches_scalar(self):
+        """add_workdays_array agrees with add_workdays for every start weekday."""
+        workdays = [0, 0.5, 1, 2.9, 3, 4, 5, 6, 9, 10, 23, 260]
+        for offset in range(7):
+            start = datetime(2026, 2, 16, 9, 30) + timedelta(days=offset)
+            assert add_workdays_array(start, workdays) == [
+                add_workdays(start, days) for days in workdays
+            ]
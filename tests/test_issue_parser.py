@@ -3,8 +3,19 @@
 from typing import Dict, List
 
 import networkx as nx
+import pytest
 
-from issue_parser import Issue, build_dependency_graph, handle_cycles, parse_jira_issues
+from issue_parser import (
+    Issue,
+    IssueTable,
+    build_dependency_graph,
+    calculate_critical_path,
+    count_descendants,
+    handle_cycles,
+    is_complete_status,
+    parse_jira_issues,
+    parse_jira_issues_soa,
+)
 
 
 def test_issue_creation():
@@ -29,6 +40,23 @@ def test_issue_completion_status():
     assert not in_progress_issue.is_complete
 
 
+def test_is_complete_status_ignores_case():
+    """Test status matching is case-insensitive, including repeated lookups."""
+    for _ in range(2):
+        assert is_complete_status("WON'T FIX")
+        assert is_complete_status("duplicate")
+        assert not is_complete_status("In Review")
+        assert not is_complete_status("")
+
+
+def test_issue_uses_slots():
+    """Test Issue has a fixed attribute layout without a per-instance __dict__."""
+    issue = Issue("TEST-1", "Slotted", "To Do", 1.0)
+    assert not hasattr(issue, "__dict__")
+    with pytest.raises(AttributeError):
+        issue.unexpected = True
+
+
 def test_parse_jira_issues_basic():
     """Test parsing basic Jira issues."""
     raw_issues = [
@@ -115,8 +143,8 @@ def test_build_dependency_graph():
     issue3 = Issue("TEST-3", "Third", "Done", 2.0)
 
     # Set up dependencies
-    issue1.blocks.add("TEST-2")
-    issue2.blocked_by.add("TEST-1")
+    issue1.blocks.append("TEST-2")
+    issue2.blocked_by.append("TEST-1")
 
     issues = {"TEST-1": issue1, "TEST-2": issue2, "TEST-3": issue3}
 
@@ -220,3 +248,137 @@ def test_parse_jira_issues_with_epic_key():
 
     assert issues["TEST-1"].epic_key == "EPIC-1"
     assert issues["TEST-2"].epic_key == "EPIC-1"
+
+
+def test_parse_jira_issues_dependency_links(sample_jira_issues):
+    """Test that blocking links are parsed in both directions."""
+    issues = parse_jira_issues(sample_jira_issues)
+
+    assert issues["TEST-2"].blocked_by == ["TEST-1"]
+    assert issues["TEST-1"].blocks == ["TEST-2"]
+    assert issues["TEST-3"].blocked_by == ["TEST-2"]
+    assert issues["TEST-2"].blocks == ["TEST-3"]
+
+
+def test_parse_jira_issues_ignores_non_dependency_links():
+    """Test that only blocking/depends links become dependencies."""
+    relates = {"name": "Relates", "inward": "relates to", "outward": "relates to"}
+    depends = {"name": "Dependency", "inward": "is needed by", "outward": "needs"}
+    raw_issues = [
+        {
+            "key": "TEST-1",
+            "fields": {
+                "summary": "First",
+                "status": {"name": "To Do"},
+                "issuelinks": [
+                    {"type": relates, "outwardIssue": {"key": "TEST-2"}},
+                    {"type": depends, "outwardIssue": {"key": "TEST-3"}},
+                ],
+            },
+        },
+        {"key": "TEST-2", "fields": {"summary": "Second", "status": {"name": "To Do"}}},
+        {"key": "TEST-3", "fields": {"summary": "Third", "status": {"name": "To Do"}}},
+    ]
+
+    issues = parse_jira_issues(raw_issues)
+
+    assert issues["TEST-1"].blocks == ["TEST-3"]
+    assert issues["TEST-2"].blocked_by == []
+    assert issues["TEST-3"].blocked_by == ["TEST-1"]
+
+
+def test_calculate_critical_path_heaviest_chain():
+    """Test the critical path is the chain with the most story points."""
+    G = nx.DiGraph()
+    G.add_node("A", story_points=5.0)
+    G.add_node("B", story_points=0.0)
+    G.add_node("C", story_points=10.0)
+    G.add_node("D", story_points=2.0)
+    G.add_edge("A", "B", weight=5.0)
+    G.add_edge("B", "D", weight=0.0)
+
+    length, path = calculate_critical_path(G)
+
+    # C alone (10) outweighs A -> B -> D (7)
+    assert length == 10.0
+    assert path == ["C"]
+
+    G.add_edge("C", "D", weight=10.0)
+    assert calculate_critical_path(G) == (12.0, ["C", "D"])
+
+
+def test_calculate_critical_path_empty_and_cyclic():
+    """Test empty graphs have no critical path and cycles are rejected."""
+    assert calculate_critical_path(nx.DiGraph()) == (0.0, [])
+
+    G = nx.DiGraph([("A", "B"), ("B", "A")])
+    with pytest.raises(nx.NetworkXUnfeasible):
+        calculate_critical_path(G)
+
+
+def test_count_descendants_matches_networkx():
+    """Test descendant counts agree with nx.descendants, including shared subtrees."""
+    G = nx.DiGraph([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E")])
+    G.add_node("F")
+
+    counts = count_descendants(G)
+
+    assert counts == {node: len(nx.descendants(G, node)) for node in G}
+    assert counts["A"] == 4
+
+
+def test_handle_cycles_self_loop_and_overlapping_cycles(capsys):
+    """Test self-loops and cycles sharing nodes are all broken."""
+    G = nx.DiGraph()
+    G.add_edges_from([("A", "B"), ("B", "A"), ("B", "C"), ("C", "A"), ("D", "D"), ("C", "E")])
+
+    G_fixed = handle_cycles(G)
+
+    assert nx.is_directed_acyclic_graph(G_fixed)
+    assert set(G_fixed.nodes()) == {"A", "B", "C", "D", "E"}
+    assert G_fixed.has_edge("C", "E")  # edges outside cycles are kept
+    assert G.number_of_edges() == 6  # input graph is left untouched
+    assert "Found 2 group(s) of circular dependencies" in capsys.readouterr().out
+
+
+def test_handle_cycles_dense_graph():
+    """Test a complete digraph (factorially many simple cycles) is handled quickly."""
+    G = nx.complete_graph(40, create_using=nx.DiGraph)
+
+    G_fixed = handle_cycles(G)
+
+    assert nx.is_directed_acyclic_graph(G_fixed)
+    assert G_fixed.number_of_nodes() == 40
+    # One direction of every pair of nodes survives
+    assert G_fixed.number_of_edges() == 40 * 39 // 2
+
+
+def test_parse_jira_issues_soa(sample_jira_issues):
+    """Test parsing straight into struct-of-arrays columns."""
+    table = parse_jira_issues_soa(sample_jira_issues, epic_key="EPIC-1")
+
+    assert len(table) == 3
+    assert table.keys == ["TEST-1", "TEST-2", "TEST-3"]
+    assert table.points.tolist() == [2.0, 5.0, 8.0]
+    assert table.complete.tolist() == [False, False, True]
+    # TEST-1 blocks TEST-2, TEST-2 blocks TEST-3
+    assert table.blocks_indptr.tolist() == [0, 1, 2, 2]
+    assert table.blocks_indices.tolist() == [1, 2]
+    assert table.epic_key == "EPIC-1"
+
+
+def test_issue_table_round_trip(sample_jira_issues):
+    """Test IssueTable converts to and from Issue objects without losing links."""
+    issues = parse_jira_issues(sample_jira_issues)
+
+    # Parsing into a table first gives the same issues as parsing them directly
+    for rebuilt in [
+        IssueTable.from_issues(issues).to_issues(),
+        parse_jira_issues_soa(sample_jira_issues).to_issues(),
+    ]:
+        assert list(rebuilt) == list(issues)
+        for key, issue in issues.items():
+            assert rebuilt[key].story_points == issue.story_points
+            assert rebuilt[key].is_complete == issue.is_complete
+            assert rebuilt[key].blocks == issue.blocks
+            assert rebuilt[key].blocked_by == issue.blocked_by
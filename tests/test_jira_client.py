@@ -0,0 +1,99 @@
+"""Tests for jira_client module."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import jira_client
+from jira_client import JiraClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """JiraClient configured from test environment variables."""
+    monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net/")
+    monkeypatch.setenv("JIRA_EMAIL", "dev@example.com")
+    monkeypatch.setenv("JIRA_TOKEN", "secret")
+    return JiraClient()
+
+
+def _page(issues, next_page_token=None):
+    data = {"issues": issues, "isLast": next_page_token is None, "nextPageToken": next_page_token}
+    response = MagicMock()
+    response.json.return_value = data
+    response.content = json.dumps(data).encode()
+    return response
+
+
+def test_client_uses_authenticated_session(client):
+    """Test the client keeps one authenticated session."""
+    assert client.base_url == "https://example.atlassian.net"
+    assert client.session.auth == ("dev@example.com", "secret")
+
+
+def test_missing_environment_raises(monkeypatch):
+    """Test missing credentials are rejected."""
+    monkeypatch.delenv("JIRA_BASE_URL", raising=False)
+    monkeypatch.setenv("JIRA_EMAIL", "dev@example.com")
+    monkeypatch.setenv("JIRA_TOKEN", "secret")
+
+    with pytest.raises(ValueError, match="Missing required environment variables") as excinfo:
+        JiraClient()
+    assert str(excinfo.value).endswith(": JIRA_BASE_URL")
+
+
+def test_missing_environment_lists_every_missing_variable(monkeypatch):
+    """Test the error names all missing variables, in a stable order."""
+    monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
+    monkeypatch.delenv("JIRA_EMAIL", raising=False)
+    monkeypatch.setenv("JIRA_TOKEN", "")
+
+    with pytest.raises(ValueError, match="JIRA_EMAIL, JIRA_TOKEN$"):
+        JiraClient()
+
+
+def test_search_jql_follows_page_tokens(client):
+    """Test search_jql collects every page through the shared session."""
+    client.session.get = MagicMock(
+        side_effect=[_page([{"key": "A-1"}], "token-2"), _page([{"key": "A-2"}])]
+    )
+
+    issues = client.search_jql("project = A", ["summary", "status"])
+
+    assert [issue["key"] for issue in issues] == ["A-1", "A-2"]
+    assert client.session.get.call_count == 2
+    second_params = client.session.get.call_args_list[1].kwargs["params"]
+    assert second_params["nextPageToken"] == "token-2"
+    assert second_params["fields"] == "summary,status"
+
+
+def test_search_jql_without_orjson(client, monkeypatch):
+    """Test responses fall back to the stdlib JSON decoder."""
+    monkeypatch.setattr(jira_client, "orjson", None)
+    client.session.get = MagicMock(return_value=_page([{"key": "A-1"}]))
+
+    assert client.search_jql("project = A", ["summary"]) == [{"key": "A-1"}]
+
+
+def test_search_jql_stops_on_empty_page(client):
+    """Test an empty page ends pagination even if the server reports more."""
+    client.session.get = MagicMock(
+        side_effect=[_page([{"key": "A-1"}], "token-2"), _page([], "token-3")]
+    )
+
+    assert client.search_jql("project = A", ["summary"]) == [{"key": "A-1"}]
+    assert client.session.get.call_count == 2
+    assert "nextPageToken" not in client.session.get.call_args_list[0].kwargs["params"]
+
+
+def test_session_retries_transient_errors(client):
+    """Test the session adapter retries throttled and server-error GETs."""
+    adapter = client.session.get_adapter("https://example.atlassian.net/rest/api/3/search/jql")
+    retry = adapter.max_retries
+
+    assert retry.total == 5
+    assert 429 in retry.status_forcelist
+    assert 503 in retry.status_forcelist
+    assert "GET" in retry.allowed_methods
+    assert "POST" not in retry.allowed_methods
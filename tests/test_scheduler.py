@@ -1,8 +1,13 @@
 """Tests for scheduler module."""
 
+import importlib.util
+import random
+import tracemalloc
+
+import numpy as np
 import pytest
 
-from scheduler import TaskScheduler
+from scheduler import INITIAL_TASK_CAPACITY, TaskScheduler
 
 
 def test_scheduler_initialization():
@@ -11,63 +16,138 @@ def test_scheduler_initialization():
     assert scheduler.num_engineers == 3
     assert len(scheduler.engineer_schedules) == 3
     assert len(scheduler.engineer_end_times) == 3
-    assert all(end_time == 0 for end_time in scheduler.engineer_end_times)
-
-
-def test_schedule_single_task():
-    """Test scheduling a single task."""
-    scheduler = TaskScheduler(num_engineers=2)
-    engineer = scheduler.schedule_task("Task1", duration_days=5.0, dependencies=[])
-
-    assert engineer in [0, 1]
-    assert scheduler.get_project_duration() == 5.0
-    assert "Task1" in scheduler.task_start_times
-    assert scheduler.task_start_times["Task1"] == 0
-    assert scheduler.task_end_times["Task1"] == 5.0
-
-
-def test_schedule_dependent_tasks():
-    """Test scheduling tasks with dependencies."""
-    scheduler = TaskScheduler(num_engineers=2)
-
-    # Schedule first task
-    scheduler.schedule_task("Task1", duration_days=3.0, dependencies=[])
-
-    # Schedule dependent task
-    scheduler.schedule_task("Task2", duration_days=2.0, dependencies=["Task1"])
+    np.testing.assert_array_equal(scheduler.engineer_end_times, 0.0)
+
+
+@pytest.mark.parametrize(
+    "tasks,expected_duration,expected_starts,expected_engineers",
+    [
+        ([("Task1", 5.0, [])], 5.0, {"Task1": 0.0}, [0]),
+        (
+            [("Task1", 5.0, []), ("Task2", 3.0, [])],
+            5.0,
+            {"Task1": 0.0, "Task2": 0.0},
+            [0, 1],
+        ),
+        (
+            [("Task1", 3.0, []), ("Task2", 2.0, ["Task1"])],
+            5.0,
+            {"Task1": 0.0, "Task2": 3.0},
+            [0, 0],
+        ),
+    ],
+    ids=["single", "parallel", "dependent"],
+)
+def test_schedule_tasks(
+    make_scheduler, tasks, expected_duration, expected_starts, expected_engineers
+):
+    """Test start times, engineers and duration for single, parallel and dependent tasks."""
+    scheduler = make_scheduler(2)
+    engineers = [scheduler.schedule_task(name, duration, deps) for name, duration, deps in tasks]
+
+    # Independent tasks go to different engineers; a dependent task waits for its blocker
+    assert engineers == expected_engineers
+    assert scheduler.task_start_times == expected_starts
+    assert scheduler.get_project_duration() == expected_duration
+
+
+def test_tied_engineers_pick_lowest_index(make_scheduler):
+    """Test ties between engineers who can start equally early go to the lowest index."""
+    scheduler = make_scheduler(3)
+    scheduler.schedule_task("Task1", duration_days=2.0, dependencies=[])
+    scheduler.schedule_task("Task2", duration_days=1.0, dependencies=[])
+    scheduler.schedule_task("Task3", duration_days=4.0, dependencies=[])
+
+    # Engineers 0 and 1 are both free by day 2; the dependency makes them tie
+    engineer = scheduler.schedule_task("Task4", duration_days=1.0, dependencies=["Task1"])
+
+    assert engineer == 0
+    assert scheduler.task_start_times["Task4"] == 2.0
+
+
+def test_many_engineers_assignment():
+    """Test 100k independent tasks over 10k engineers are balanced."""
+    rng = random.Random(0)
+    durations = [rng.uniform(0.5, 5.0) for _ in range(100_000)]
+    scheduler = TaskScheduler(num_engineers=10_000)
+
+    for i, duration in enumerate(durations):
+        scheduler.schedule_task(f"Task{i}", duration, [])
+
+    # Greedy list scheduling: nobody finishes more than one task after anyone else
+    end_times = scheduler.engineer_end_times
+    assert end_times.max() - end_times.min() <= max(durations)
+    assert np.bincount(scheduler.task_engineer, minlength=10_000).min() > 0
+
+
+def test_even_distribution_argmin(make_scheduler):
+    """Test 1000 independent tasks spread evenly over 8 engineers."""
+    rng = random.Random(0)
+    scheduler = make_scheduler(8)
+    for i in range(1000):
+        scheduler.schedule_task(f"Task{i}", rng.uniform(0.5, 5.0), [])
+
+    util = scheduler.get_engineer_utilization()
+    assert np.std(util) < 10.0
+    # Each task goes to the engineer who frees up first
+    assert np.bincount(scheduler.task_engineer, minlength=8).min() > 100
+
+
+def test_schedule_task_records_dependency_rows(make_scheduler):
+    """Test a task scheduled after 10k others waits on, and stores, just its 3 dependencies."""
+    scheduler = make_scheduler(4)
+    for i in range(10_000):
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0, dependencies=[])
+
+    scheduler.schedule_task("X", 1.0, ["Task5", "Task99", "Task9999"])
+
+    assert scheduler.task_dependency_rows[-1] == [5, 99, 9999]
+    assert scheduler.dependency_indptr[-2:].tolist() == [0, 3]
+    assert scheduler.task_start_times["X"] == scheduler.task_end_times["Task9999"]
+
+
+def test_project_duration_cached(make_scheduler):
+    """Test the project duration is tracked as tasks are scheduled, not rescanned per call."""
+    scheduler = make_scheduler(1000)
+    for i in range(1000):
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0 + i % 13, dependencies=[])
+    assert scheduler.get_project_duration() == scheduler.engineer_end_times.max() == 13.0
+
+    # Clearing the end times behind the scheduler's back leaves the tracked value alone
+    scheduler.engineer_end_times[:] = 0.0
+    assert scheduler.get_project_duration() == 13.0
+
+
+def test_no_engineers_rejects_tasks():
+    """Test scheduling on an empty team raises ValueError."""
+    scheduler = TaskScheduler(num_engineers=0)
+
+    with pytest.raises(ValueError, match="No engineers"):
+        scheduler.schedule_task("Task1", duration_days=1.0, dependencies=[])
+
+
+@pytest.mark.parametrize("bad", [-1e-9, -1.0, -1e9, float("-inf"), float("nan")])
+def test_schedule_invalid_duration(make_scheduler, bad):
+    """Test that negative and NaN durations raise ValueError without scheduling anything."""
+    scheduler = make_scheduler(2)
 
-    # Task2 should start after Task1 ends
-    assert scheduler.task_start_times["Task2"] == 3.0
-    assert scheduler.task_end_times["Task2"] == 5.0
-    assert scheduler.get_project_duration() == 5.0
-
-
-def test_schedule_parallel_tasks():
-    """Test scheduling parallel tasks."""
-    scheduler = TaskScheduler(num_engineers=2)
-
-    # Schedule two independent tasks
-    eng1 = scheduler.schedule_task("Task1", duration_days=5.0, dependencies=[])
-    eng2 = scheduler.schedule_task("Task2", duration_days=3.0, dependencies=[])
-
-    # Should be assigned to different engineers
-    assert eng1 != eng2
-
-    # Project duration should be the max of the two
-    assert scheduler.get_project_duration() == 5.0
+    with pytest.raises(ValueError, match="Duration must be non-negative"):
+        scheduler.schedule_task("Task1", duration_days=bad, dependencies=[])
+    assert scheduler.task_names == []
 
 
-def test_schedule_negative_duration():
-    """Test that negative duration raises ValueError."""
-    scheduler = TaskScheduler(num_engineers=2)
+def test_scheduler_uses_slots():
+    """Test the scheduler has no per-instance __dict__."""
+    scheduler = TaskScheduler(num_engineers=1)
 
-    with pytest.raises(ValueError, match="Duration must be non-negative"):
-        scheduler.schedule_task("Task1", duration_days=-5.0, dependencies=[])
+    assert not hasattr(scheduler, "__dict__")
+    with pytest.raises(AttributeError):
+        scheduler.unknown_attribute = 1
 
 
-def test_get_engineer_utilization():
+def test_get_engineer_utilization(make_scheduler):
     """Test engineer utilization calculation."""
-    scheduler = TaskScheduler(num_engineers=2)
+    scheduler = make_scheduler(2)
 
     # Engineer 0 gets 10 days of work
     scheduler.schedule_task("Task1", duration_days=10.0, dependencies=[])
@@ -80,40 +160,341 @@ def test_get_engineer_utilization():
     # Project duration is 10 days
     # Engineer 0: 10/10 = 100%
     # Engineer 1: 5/10 = 50%
-    assert utilization[0] == 100.0
-    assert utilization[1] == 50.0
+    np.testing.assert_allclose(utilization, [100.0, 50.0])
 
 
-def test_empty_scheduler():
+def test_empty_scheduler(make_scheduler):
     """Test scheduler with no tasks."""
-    scheduler = TaskScheduler(num_engineers=2)
+    scheduler = make_scheduler(2)
 
     assert scheduler.get_project_duration() == 0
     utilization = scheduler.get_engineer_utilization()
-    assert all(util == 0.0 for util in utilization)
+    assert utilization.shape == (2,)
+    np.testing.assert_array_equal(utilization, 0.0)
 
 
-def test_complex_dependency_chain():
-    """Test scheduling a complex dependency chain."""
-    scheduler = TaskScheduler(num_engineers=3)
+def test_complex_dependency_chain(make_scheduler):
+    """Test scheduling a complex dependency chain in one batch, listed out of order."""
+    scheduler = make_scheduler(3)
 
-    # Task1 (5 days)
-    scheduler.schedule_task("Task1", duration_days=5.0, dependencies=[])
+    # Task1 (5 days) -> Task2 (3 days) -> Task3 (2 days); Task4 (4 days) also follows Task1
+    engineers = scheduler.schedule_tasks(
+        [
+            ("Task3", 2.0, ["Task2"]),
+            ("Task4", 4.0, ["Task1"]),
+            ("Task2", 3.0, ["Task1"]),
+            ("Task1", 5.0, []),
+        ]
+    )
 
-    # Task2 depends on Task1 (3 days)
-    scheduler.schedule_task("Task2", duration_days=3.0, dependencies=["Task1"])
+    # Total duration should be the critical path: Task1 -> Task2 -> Task3 = 10 days
+    assert scheduler.get_project_duration() == 10.0
 
-    # Task3 depends on Task2 (2 days)
-    scheduler.schedule_task("Task3", duration_days=2.0, dependencies=["Task2"])
+    # Rows follow scheduling order: Task1, then Task4 and Task2 (batch order), then Task3
+    assert scheduler.task_names == ["Task1", "Task4", "Task2", "Task3"]
+    np.testing.assert_array_equal(scheduler.task_start, [0.0, 5.0, 5.0, 8.0])
+    np.testing.assert_array_equal(engineers, [1, 0, 1, 0])
 
-    # Task4 depends on Task1 (parallel with Task2/Task3)
-    scheduler.schedule_task("Task4", duration_days=4.0, dependencies=["Task1"])
 
-    # Total duration should be the critical path: Task1 -> Task2 -> Task3 = 10 days
-    assert scheduler.get_project_duration() == 10.0
+def test_compute_critical_path(make_scheduler):
+    """Test the critical path follows the heaviest dependency chain, not engineer order."""
+    scheduler = make_scheduler(3)
+    assert scheduler.compute_critical_path() == []
 
-    # Verify start times
-    assert scheduler.task_start_times["Task1"] == 0
-    assert scheduler.task_start_times["Task2"] == 5.0
-    assert scheduler.task_start_times["Task3"] == 8.0
-    assert scheduler.task_start_times["Task4"] == 5.0  # Parallel with Task2
+    scheduler.schedule_task("Task1", duration_days=5.0, dependencies=[])
+    scheduler.schedule_task("Task2", duration_days=3.0, dependencies=["Task1"])
+    scheduler.schedule_task("Task3", duration_days=2.0, dependencies=["Task2"])
+    scheduler.schedule_task("Task4", duration_days=4.0, dependencies=["Task1", "External"])
+
+    assert scheduler.compute_critical_path() == ["Task1", "Task2", "Task3"]
+
+
+def test_critical_path_large_dag(make_scheduler):
+    """Test the critical path on a ~10k-edge layered DAG against a fixpoint reference."""
+    rng = random.Random(0)
+    layers = [[f"L{layer}-{i}" for i in range(100)] for layer in range(21)]
+    durations = {}
+    dependencies = {}
+    for layer, names in enumerate(layers):
+        for name in names:
+            durations[name] = rng.uniform(0.5, 10.0)
+            dependencies[name] = rng.sample(layers[layer - 1], 5) if layer else []
+
+    scheduler = make_scheduler(8)
+    for names in layers:
+        for name in names:
+            scheduler.schedule_task(name, durations[name], dependencies[name])
+    assert sum(len(deps) for deps in dependencies.values()) == 10_000
+
+    path = scheduler.compute_critical_path()
+
+    # Reference: relax every edge until no chain gets longer
+    longest = dict(durations)
+    changed = True
+    while changed:
+        changed = False
+        for name, deps in dependencies.items():
+            best = max((longest[dep] for dep in deps), default=0.0) + durations[name]
+            if best > longest[name]:
+                longest[name] = best
+                changed = True
+
+    assert all(blocker in dependencies[task] for blocker, task in zip(path, path[1:]))
+    assert sum(durations[name] for name in path) == pytest.approx(max(longest.values()))
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numba") is None, reason="numba not installed")
+def test_critical_path_jit_matches_python(make_scheduler):
+    """Test the numba critical path agrees with the Python sweep on 50k tasks."""
+    rng = random.Random(0)
+    layers = [[f"L{layer}-{i}" for i in range(1000)] for layer in range(50)]
+    scheduler = make_scheduler(16)
+    for layer, names in enumerate(layers):
+        for name in names:
+            dependencies = rng.sample(layers[layer - 1], 5) if layer else []
+            scheduler.schedule_task(name, rng.uniform(0.5, 10.0), dependencies)
+
+    expected = scheduler.compute_critical_path()
+    assert scheduler.compute_critical_path(jit=True) == expected
+
+
+def test_schedule_tasks_matches_one_at_a_time(make_scheduler):
+    """Test a topologically ordered batch schedules exactly like successive schedule_task calls."""
+    tasks = [
+        ("Task1", 5.0, []),
+        ("Task2", 3.0, ["Task1"]),
+        ("Task3", 2.0, ["Task2", "Task2"]),
+        ("Task4", 4.0, ["Task1", "External"]),
+    ]
+    expected = make_scheduler(3)
+    expected_engineers = [expected.schedule_task(*task) for task in tasks]
+
+    scheduler = make_scheduler(3)
+    engineers = scheduler.schedule_tasks(tasks)
+
+    assert engineers.tolist() == expected_engineers
+    assert scheduler.task_start_times == expected.task_start_times
+    assert scheduler.task_end_times == expected.task_end_times
+
+
+def test_schedule_tasks_rejects_cycles_and_negative_durations(make_scheduler):
+    """Test invalid batches raise before any task is scheduled."""
+    scheduler = make_scheduler(2)
+
+    with pytest.raises(ValueError, match="cycle"):
+        scheduler.schedule_tasks([("Task1", 1.0, ["Task2"]), ("Task2", 1.0, ["Task1"])])
+    with pytest.raises(ValueError, match="Duration must be non-negative"):
+        scheduler.schedule_tasks([("Task1", 1.0, []), ("Task2", -1.0, [])])
+    assert scheduler.task_names == []
+
+
+def _build_batch_soa(num_tasks, seed=0):
+    """Build a random DAG batch as parallel name, duration and dependency-position arrays."""
+    rng = np.random.default_rng(seed)
+    names = [f"Task{i}" for i in range(num_tasks)]
+    durations = rng.uniform(0.5, 10.0, size=num_tasks)
+    deps = [
+        rng.choice(i, size=min(i, int(rng.integers(0, 4))), replace=False) for i in range(num_tasks)
+    ]
+    # Reverse the batch so tasks are listed after their dependents
+    order = np.arange(num_tasks)[::-1]
+    position = np.empty(num_tasks, dtype=np.int64)
+    position[order] = np.arange(num_tasks)
+    return (
+        [names[i] for i in order],
+        durations[order],
+        [position[deps[i]] for i in order],
+    )
+
+
+def test_schedule_tasks_soa(make_scheduler):
+    """Test the parallel-array batch API schedules exactly like the tuple batch API."""
+    names, durs, deps = _build_batch_soa(500)
+    tasks = [
+        (name, float(duration), [names[j] for j in task_deps])
+        for name, duration, task_deps in zip(names, durs, deps)
+    ]
+    expected = make_scheduler(4)
+    expected_engineers = expected.schedule_tasks(tasks)
+
+    scheduler = make_scheduler(4)
+    engineers = scheduler.schedule_tasks_soa(names, durs, deps)
+
+    np.testing.assert_array_equal(engineers, expected_engineers)
+    assert scheduler.task_names == expected.task_names
+    assert scheduler.task_start_times == expected.task_start_times
+    assert scheduler.task_end_times == expected.task_end_times
+    assert scheduler.compute_critical_path() == expected.compute_critical_path()
+
+
+def test_schedule_tasks_soa_rejects_invalid_batches(make_scheduler):
+    """Test invalid parallel-array batches raise before any task is scheduled."""
+    scheduler = make_scheduler(2)
+    names = ["Task1", "Task2"]
+    no_deps = [np.array([], dtype=np.int64)] * 2
+
+    with pytest.raises(ValueError, match="cycle"):
+        scheduler.schedule_tasks_soa(names, np.ones(2), [np.array([1]), np.array([0])])
+    with pytest.raises(ValueError, match="Duration must be non-negative.*Task2"):
+        scheduler.schedule_tasks_soa(names, np.array([1.0, np.nan]), no_deps)
+    with pytest.raises(ValueError, match="out of range"):
+        scheduler.schedule_tasks_soa(names, np.ones(2), [np.array([2]), np.array([])])
+    with pytest.raises(ValueError, match="Expected 2 durations and dependency arrays"):
+        scheduler.schedule_tasks_soa(names, np.ones(3), no_deps)
+    with pytest.raises(ValueError, match="Expected 2 durations and dependency arrays"):
+        scheduler.schedule_tasks_soa(names, np.ones(2), no_deps[:1])
+    assert scheduler.task_names == []
+
+
+def test_star_dag_schedule(make_scheduler):
+    """Test a star DAG (one root, every other task waiting on it) orders and sweeps correctly."""
+    num_tasks = 100_000
+    names = [f"Task{i}" for i in range(num_tasks)]
+    # List the leaves first so the whole batch waits on the last task
+    root = np.array([num_tasks - 1])
+    deps = [root] * (num_tasks - 1) + [np.array([], dtype=np.int64)]
+    scheduler = make_scheduler(8)
+
+    scheduler.schedule_tasks_soa(names, np.ones(num_tasks), deps)
+    path = scheduler.compute_critical_path()
+
+    assert scheduler.task_names[0] == names[-1]
+    assert scheduler.task_names[1:] == names[:-1]
+    assert path == [names[-1], names[0]]
+    assert scheduler.get_project_duration() == 1.0 + np.ceil((num_tasks - 1) / 8)
+
+
+def test_task_times_are_live_views(make_scheduler):
+    """Test task time mappings read the columns through task_index, across growth."""
+    scheduler = make_scheduler(1)
+    starts = scheduler.task_start_times
+    for i in range(INITIAL_TASK_CAPACITY + 1):
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0, dependencies=[])
+    # A rescheduled name resolves to its latest row
+    scheduler.schedule_task("Task0", duration_days=2.0, dependencies=[])
+
+    assert len(starts) == INITIAL_TASK_CAPACITY + 1
+    assert starts[f"Task{INITIAL_TASK_CAPACITY}"] == INITIAL_TASK_CAPACITY
+    assert scheduler.task_end_times["Task0"] == INITIAL_TASK_CAPACITY + 3.0
+    assert list(starts)[:2] == ["Task0", "Task1"]
+    assert "Missing" not in starts
+
+
+def test_engineer_task_rows_csr(make_scheduler):
+    """Test the per-engineer CSR lists each engineer's rows in scheduling order."""
+    scheduler = make_scheduler(3)
+    scheduler.schedule_task("Task1", duration_days=2.0, dependencies=[])
+    scheduler.schedule_task("Task2", duration_days=1.0, dependencies=[])
+    scheduler.schedule_task("Task3", duration_days=4.0, dependencies=[])
+    scheduler.schedule_task("Task4", duration_days=1.0, dependencies=[])
+
+    indptr, rows = scheduler.engineer_task_rows
+
+    # Engineer 1 frees up first and takes Task4
+    np.testing.assert_array_equal(indptr, [0, 1, 3, 4])
+    np.testing.assert_array_equal(rows, [0, 1, 3, 2])
+    assert [task["task"] for task in scheduler.engineer_schedules[1]] == ["Task2", "Task4"]
+
+
+def test_memory_footprint_large():
+    """Test the per-engineer CSR costs a few bytes per task, unlike per-task dicts."""
+    tasks = 100_000
+    scheduler = TaskScheduler(num_engineers=64, expected_tasks=tasks)
+    for i in range(tasks):
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0 + i % 7, dependencies=[])
+
+    tracemalloc.start()
+    try:
+        indptr, rows = scheduler.engineer_task_rows
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert indptr[-1] == rows.shape[0] == tasks
+    assert peak < 24 * tasks
+
+
+def test_init_presize():
+    """Test expected_tasks allocates the columns once for that many tasks."""
+    expected_tasks = INITIAL_TASK_CAPACITY * 4
+    scheduler = TaskScheduler(num_engineers=2, expected_tasks=expected_tasks)
+    columns = (scheduler._start, scheduler._end, scheduler._dependency_indptr)
+
+    for i in range(expected_tasks):
+        dependencies = [f"Task{i - 1}"] if i else []
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0, dependencies=dependencies)
+
+    current = (scheduler._start, scheduler._end, scheduler._dependency_indptr)
+    assert all(column is before for column, before in zip(current, columns))
+    assert scheduler._dependency_indices.shape[0] == expected_tasks
+    assert scheduler.get_project_duration() == expected_tasks
+
+
+def test_float32_equivalence():
+    """Test a float32 scheduler matches float64 on the dependency chain and utilization cases."""
+    chain = [
+        ("Task1", 5.0, []),
+        ("Task2", 3.0, ["Task1"]),
+        ("Task3", 2.0, ["Task2"]),
+        ("Task4", 4.0, ["Task1"]),
+        ("Task5", 10.0 / 3, ["Task4"]),
+    ]
+    results = {}
+    for dtype in (np.float64, np.float32):
+        scheduler = TaskScheduler(num_engineers=3, dtype=dtype)
+        engineers = scheduler.schedule_tasks(chain)
+        results[dtype] = (scheduler, engineers)
+
+    wide, narrow = results[np.float64][0], results[np.float32][0]
+    assert narrow.task_start.dtype == narrow.engineer_end_times.dtype == np.float32
+    np.testing.assert_array_equal(results[np.float32][1], results[np.float64][1])
+    np.testing.assert_allclose(narrow.task_start, wide.task_start, atol=1e-5)
+    np.testing.assert_allclose(narrow.task_end, wide.task_end, atol=1e-5)
+    np.testing.assert_allclose(
+        narrow.get_engineer_utilization(), wide.get_engineer_utilization(), atol=1e-5
+    )
+    assert narrow.get_project_duration() == pytest.approx(wide.get_project_duration(), abs=1e-5)
+
+
+def test_reset_clears_tasks_and_keeps_columns():
+    """Test reset empties the schedule, resizes the team and reuses the task columns."""
+    scheduler = TaskScheduler(num_engineers=2)
+    scheduler.schedule_task("Task1", duration_days=5.0, dependencies=[])
+    columns = scheduler._start
+
+    scheduler.reset(3)
+
+    assert scheduler.num_engineers == 3
+    assert scheduler.engineer_end_times.tolist() == [0.0, 0.0, 0.0]
+    assert scheduler.task_start_times == {}
+    assert scheduler._start is columns
+    # The cleared Task1 no longer delays anything depending on that name
+    assert scheduler.schedule_task("Task1", duration_days=1.0, dependencies=["Task1"]) == 0
+    assert scheduler.task_start_times == {"Task1": 0.0}
+
+
+def test_make_scheduler_hands_out_distinct_schedulers(make_scheduler):
+    """Test asking twice for one team size in a test doesn't reset the first scheduler."""
+    first = make_scheduler(2)
+    first.schedule_task("Task1", duration_days=5.0, dependencies=[])
+
+    second = make_scheduler(2)
+
+    assert second is not first
+    assert second.task_names == []
+    assert first.task_start_times == {"Task1": 0.0}
+
+
+def test_task_columns_grow_past_initial_capacity(make_scheduler):
+    """Test scheduled tasks are kept as columns, in scheduling order, beyond one allocation."""
+    scheduler = make_scheduler(2)
+    count = INITIAL_TASK_CAPACITY * 2 + 1
+    for i in range(count):
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0, dependencies=[])
+
+    assert scheduler.task_names == [f"Task{i}" for i in range(count)]
+    assert scheduler.task_index[f"Task{count - 1}"] == count - 1
+    np.testing.assert_array_equal(scheduler.task_engineer[:4], [0, 1, 0, 1])
+    np.testing.assert_array_equal(scheduler.task_end - scheduler.task_start, 1.0)
+    assert scheduler.task_end_times[f"Task{count - 1}"] == scheduler.get_project_duration()
+    assert sum(len(tasks) for tasks in scheduler.engineer_schedules) == count
@@ -0,0 +1,76 @@
+"""Throughput benchmarks for the scheduler hot paths (run with make benchmark)."""
+
+import itertools
+import random
+import time
+
+import pytest
+
+from scheduler import TaskScheduler
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def power_law_batch():
+    """100k tasks with 0-3 dependencies, skewed towards early tasks (hubs fan out widely)."""
+    rng = random.Random(42)
+    batch = []
+    for i in range(100_000):
+        deps = {int(i * rng.random() ** 3) for _ in range(rng.randint(0, 3))} if i else set()
+        batch.append((f"Task{i}", rng.uniform(0.5, 8.0), [f"Task{dep}" for dep in deps]))
+    return batch
+
+
+def test_bench_schedule_many(benchmark, power_law_batch):
+    """Benchmark scheduling 100k dependent tasks across 32 engineers in one batch."""
+    scheduler = TaskScheduler(num_engineers=32)
+
+    engineers = benchmark.pedantic(
+        scheduler.schedule_tasks, args=(power_law_batch,), setup=scheduler.reset, rounds=3
+    )
+
+    assert len(engineers) == len(power_law_batch)
+    assert scheduler.get_project_duration() > 0
+
+
+def test_bench_critical_path_jit(benchmark):
+    """Benchmark the numba critical path sweep, which should outrun the Python one 5x."""
+    pytest.importorskip("numba")
+    rng = random.Random(0)
+    layers = [[f"L{layer}-{i}" for i in range(1000)] for layer in range(50)]
+    scheduler = TaskScheduler(num_engineers=16)
+    for layer, names in enumerate(layers):
+        for name in names:
+            dependencies = rng.sample(layers[layer - 1], 5) if layer else []
+            scheduler.schedule_task(name, rng.uniform(0.5, 10.0), dependencies)
+
+    python_timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        expected = scheduler.compute_critical_path()
+        python_timings.append(time.perf_counter() - started)
+
+    path = benchmark.pedantic(
+        scheduler.compute_critical_path, kwargs={"jit": True}, rounds=3, warmup_rounds=1
+    )
+
+    assert path == expected
+    assert benchmark.stats.stats.min * 5 < min(python_timings)
+
+
+@pytest.mark.parametrize("history", [100, 10_000])
+def test_bench_schedule_task_after_history(benchmark, history):
+    """Benchmark one 3-dependency schedule_task call; its cost shouldn't grow with history."""
+    scheduler = TaskScheduler(num_engineers=4)
+    for i in range(history):
+        scheduler.schedule_task(f"Task{i}", duration_days=1.0, dependencies=[])
+    names = (f"X{attempt}" for attempt in itertools.count())
+    dependencies = ["Task5", "Task99", f"Task{history - 1}"]
+
+    benchmark.group = "schedule_task"
+    benchmark(lambda: scheduler.schedule_task(next(names), 1.0, dependencies))
+
+    assert benchmark.stats.stats.min < 1e-3
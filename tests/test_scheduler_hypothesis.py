@@ -0,0 +1,57 @@
+"""Property-based tests for the scheduler on random dependency DAGs."""
+
+from datetime import timedelta
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from scheduler import TaskScheduler
+
+
+@st.composite
+def task_dags(draw, max_tasks=1000):
+    """Tasks as (name, duration, dependencies), each depending only on earlier tasks."""
+    durations = draw(st.lists(st.floats(0.0, 100.0), max_size=max_tasks))
+    tasks = []
+    for i, duration in enumerate(durations):
+        deps = draw(st.lists(st.integers(0, i - 1), max_size=4)) if i else []
+        tasks.append((f"Task{i}", duration, [f"Task{dep}" for dep in deps]))
+    return tasks
+
+
+def _longest_chain(tasks):
+    """Reference critical path length: tasks are listed in topological order."""
+    finish = {}
+    for name, duration, deps in tasks:
+        finish[name] = max((finish[dep] for dep in deps), default=0.0) + duration
+    return max(finish.values(), default=0.0)
+
+
+@settings(max_examples=50, deadline=timedelta(milliseconds=500))
+@given(tasks=task_dags())
+def test_unconstrained_duration_is_critical_path(tasks):
+    """With an engineer per task, every task starts as soon as its dependencies end."""
+    scheduler = TaskScheduler(num_engineers=max(len(tasks), 1))
+    for task in tasks:
+        scheduler.schedule_task(*task)
+
+    critical_path = _longest_chain(tasks)
+    assert scheduler.get_project_duration() == pytest.approx(critical_path)
+    durations = {name: duration for name, duration, _ in tasks}
+    path = scheduler.compute_critical_path()
+    assert sum(durations[name] for name in path) == pytest.approx(critical_path)
+
+
+@settings(max_examples=50, deadline=timedelta(milliseconds=500))
+@given(tasks=task_dags(), num_engineers=st.integers(1, 16))
+def test_duration_between_critical_path_and_total_work(tasks, num_engineers):
+    """A small team can't beat the critical path, and never idles past the total work."""
+    scheduler = TaskScheduler(num_engineers)
+    for task in tasks:
+        scheduler.schedule_task(*task)
+
+    duration = scheduler.get_project_duration()
+    total_work = sum(duration for _, duration, _ in tasks)
+    assert _longest_chain(tasks) <= duration + 1e-9
+    assert duration <= total_work + 1e-9
@@ -0,0 +1,84 @@
+"""Tests for the numba-compiled simulation kernel."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from epic_timeline_estimator import MAX_WORKDAYS, EpicAnalyzer
+from issue_parser import Issue
+
+pytest.importorskip("numba")
+
+from simulation_kernel import simulate_batch  # noqa: E402
+
+
+def _link(blocker, blocked):
+    blocker.blocks.append(blocked.key)
+    blocked.blocked_by.append(blocker.key)
+
+
+def _analyzer(issues_by_epic):
+    analyzer = EpicAnalyzer(MagicMock())
+    analyzer.issues = {k: i for issues in issues_by_epic.values() for k, i in issues.items()}
+    analyzer.issues_by_epic = issues_by_epic
+    analyzer.epic_keys = list(issues_by_epic)
+    return analyzer
+
+
+def _run_kernel(analyzer, workdays, num_engineers):
+    partition = analyzer._partition_issues()
+    epic_index = analyzer._index_epics()
+    return simulate_batch(
+        workdays,
+        num_engineers,
+        partition["dependents_indptr"],
+        partition["dependents_indices"],
+        partition["unmet_by_rank"],
+        epic_index["epic_indptr"],
+        epic_index["epic_indices"],
+        epic_index["pending_by_epic"],
+        MAX_WORKDAYS,
+    )
+
+
+@pytest.mark.parametrize("num_engineers", [1, 2, 5])
+def test_matches_python_simulation(num_engineers):
+    """Every run matches EpicAnalyzer._simulate_schedule, including per-epic days."""
+    issues = {f"T-{i}": Issue(f"T-{i}", f"Task {i}", "To Do", float(i % 5)) for i in range(12)}
+    for blocker, blocked in [(0, 3), (1, 3), (3, 7), (2, 8), (8, 9), (9, 11)]:
+        _link(issues[f"T-{blocker}"], issues[f"T-{blocked}"])
+    issues["T-5"].status = "Done"
+    issues["T-5"].is_complete = True
+    issues["T-10"].blocked_by.append("EXT-1")  # never resolves
+    keys = list(issues)
+    analyzer = _analyzer(
+        {
+            "E-1": {k: issues[k] for k in keys[:6]},
+            "E-2": {k: issues[k] for k in keys[6:10]},
+            "E-3": {k: issues[k] for k in keys[10:]},
+        }
+    )
+
+    workdays = analyzer._sample_workdays_batch(50, 0.5, 0.3, np.random.default_rng(7))
+    completion_days, epic_days = _run_kernel(analyzer, workdays, num_engineers)
+
+    epic_order = analyzer._index_epics()["epic_order"]
+    for run, row in enumerate(workdays.tolist()):
+        expected = analyzer._simulate_schedule(row, num_engineers)
+        assert completion_days[run] == expected["completion_day"]
+        for column, epic_key in enumerate(epic_order):
+            expected_day = expected["epic_completion_days"][epic_key]
+            assert epic_days[run, column] == (-1 if expected_day is None else expected_day)
+
+
+def test_completed_epic_finishes_on_first_day():
+    """Epics with nothing outstanding complete on day 1."""
+    done = Issue("D-1", "Done", "Done", 3.0)
+    todo = Issue("T-1", "Todo", "To Do", 3.0)
+    analyzer = _analyzer({"E-done": {"D-1": done}, "E-todo": {"T-1": todo}})
+
+    completion_days, epic_days = _run_kernel(analyzer, np.array([[3]], dtype=np.int64), 1)
+
+    assert completion_days.tolist() == [3]
+    assert epic_days.tolist() == [[1, 3]]